@@ -1,16 +1,27 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
+import io
 import json
 import random
 import re
-import subprocess
+import signal
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
 from pathlib import Path
 
 from status import Status
 
+# Upper bound on scans in flight at once
+MAX_PENDING_SCANS = 10
+# Longest stdout line accepted from bridge-cli; asyncio's default of 64 KiB
+# rejects long single-line log entries
+STREAM_LIMIT = 16 * 1024 * 1024
+
+STATUS_FILE_MARKER = "Creating status file:"
+STATUS_FILE_RE = re.compile(r"Creating status file: (.+/status\.json)")
+
 SAMPLE_POLICIES = [
     "Scan_Policy_License_Medium_Sev",
     "Scan_Policy_Security_High_Sev",
@@ -64,8 +75,16 @@ def generate_mock_policy_violation_status():
     )
 
 
-def run_scan(thread_id, verbose, tail, delay, simulate_violation=False):
-    time.sleep(delay)
+def scan_delays(count):
+    """Draw the staggered start delay for every scan in one pass."""
+    uniform = random.uniform
+    delays = [uniform(5, 10) + i * uniform(5, 10) for i in range(count)]
+    if delays:
+        delays[0] = uniform(10, 15)
+    return delays
+
+
+async def run_scan(thread_id, verbose, tail, simulate_violation=False):
     print(f"[Thread {thread_id + 1}] Incoming webhook received. Processing...")
     cmd = [
         "bridge-cli",
@@ -73,36 +92,112 @@ def run_scan(thread_id, verbose, tail, delay, simulate_violation=False):
         "--input", "input/input.json",
     ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    output_lines = []
-    if result.stdout:
-        output_lines.extend(result.stdout.splitlines())
-    if result.stderr:
-        output_lines.extend(result.stderr.splitlines())
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        limit=STREAM_LIMIT,
+    )
 
-    # Extract status file path
+    # Consume output as it arrives, picking up the status file path on the way.
+    # Unless verbose, only the last `tail` lines are ever kept.
+    output_lines = [] if verbose or tail <= 0 else deque(maxlen=tail)
     status_file = None
     status_content = None
-    for line in output_lines:
-        match = re.search(r"Creating status file: (.+/status\.json)", line)
-        if match:
-            status_file = match.group(1)
-            break
-
-    if status_file and Path(status_file).exists():
-        with open(status_file) as f:
-            status_content = Status.from_dict(json.load(f))
+    async for raw in proc.stdout:
+        line = raw.decode(errors="replace").rstrip("\n")
+        output_lines.append(line)
+        if status_file is None and STATUS_FILE_MARKER in line:
+            match = STATUS_FILE_RE.search(line)
+            if match:
+                status_file = match.group(1)
+    await proc.wait()
+
+    if status_file:
+        try:
+            # json.loads takes bytes directly, skipping the text-mode decode layer
+            status_content = Status.from_json(Path(status_file).read_bytes())
+        except FileNotFoundError:
+            pass
 
     # Simulate policy violation for designated threads
     if simulate_violation:
         status_content = generate_mock_policy_violation_status()
         status_file = "/scan/.bridge/mock/status/status.json"
 
-    if verbose:
-        return thread_id, result.returncode, output_lines, status_content, status_file
-    else:
-        return thread_id, result.returncode, output_lines[-tail:], status_content, status_file
+    return thread_id, proc.returncode, list(output_lines), status_content, status_file
+
+
+def print_result(result, verbose):
+    """Write one finished scan to stdout in a single call and return its exit code."""
+    thread_id, returncode, lines, status_content, status_file = result
+    buf = io.StringIO()
+    buf.write(f"\n=== Thread {thread_id + 1} (exit code: {returncode}) ===\n")
+    if status_file:
+        buf.write(f"Status file: {status_file}\n")
+    for line in lines:
+        buf.write(f"{line}\n")
+    if status_content:
+        # Full status dump is only useful when asked for all output
+        if verbose:
+            buf.write("\n--- Status ---\n")
+            buf.write(json.dumps(status_content.to_dict(), indent=2))
+            buf.write("\n")
+        if status_content.has_policy_violations():
+            buf.write("\n--- Policy Violations Detected ---\n")
+            summary = status_content.get_policy_violations_summary()
+            if summary:
+                buf.write(json.dumps(summary, indent=2))
+                buf.write("\n")
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+    return returncode
+
+
+async def run_scans(args):
+    """
+    Run scans concurrently on one event loop and report them as they finish.
+    Each scan is only started once its delay has elapsed, so waiting scans never
+    hold one of the MAX_PENDING_SCANS slots; finished scans are reported meanwhile.
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    exit_code = 0
+    pending = set()
+
+    def report(done):
+        nonlocal exit_code
+        for task in done:
+            returncode = print_result(task.result(), args.verbose)
+            if returncode != 0:
+                exit_code = returncode
+
+    schedule = sorted(enumerate(scan_delays(args.threads)), key=lambda item: item[1])
+    for i, delay in schedule:
+        while True:
+            wait = started + delay - loop.time()
+            if wait <= 0 and len(pending) < MAX_PENDING_SCANS:
+                break
+            if not pending:
+                await asyncio.sleep(wait)
+                continue
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=wait if wait > 0 else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            report(done)
+
+        simulate_violation = (i + 1) % 2 == 0  # Every 2nd thread (2, 4, ...)
+        pending.add(asyncio.create_task(
+            run_scan(i, args.verbose, args.tail, simulate_violation)
+        ))
+
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        report(done)
+
+    return exit_code
 
 
 def main():
@@ -122,44 +217,20 @@ def main():
         "--threads",
         type=int,
         default=5,
-        help="Number of parallel threads (default: 5)"
+        help="Number of parallel scans (default: 5)"
     )
     args = parser.parse_args()
 
-    exit_code = 0
-
-    with ThreadPoolExecutor(max_workers=args.threads) as executor:
-        futures = {}
-        for i in range(args.threads):
-            if i == 0:
-                delay = random.uniform(10, 15)
-            else:
-                delay = random.uniform(5, 10) + (i * random.uniform(5, 10))
-            simulate_violation = (i + 1) % 2 == 0  # Every 2nd thread (2, 4, ...)
-            futures[executor.submit(run_scan, i, args.verbose, args.tail, delay, simulate_violation)] = i
-
-        for future in as_completed(futures):
-            thread_id, returncode, lines, status_content, status_file = future.result()
-            print(f"\n=== Thread {thread_id + 1} (exit code: {returncode}) ===")
-            if status_file:
-                print(f"Status file: {status_file}")
-            for line in lines:
-                print(line)
-            if status_content:
-                print(f"\n--- Status ---")
-                print(json.dumps(status_content.to_dict(), indent=2))
-                if status_content.has_policy_violations():
-                    print(f"\n--- Policy Violations Detected ---")
-                    summary = status_content.get_policy_violations_summary()
-                    if summary:
-                        print(json.dumps(summary, indent=2))
-            if returncode != 0:
-                exit_code = returncode
+    exit_code = asyncio.run(run_scans(args))
 
     print("\nWaiting for incoming requests. Terminate with CTRL+C")
     try:
         while True:
-            time.sleep(1)
+            # Block in the kernel until a signal arrives instead of waking every second
+            if hasattr(signal, "pause"):
+                signal.pause()
+            else:  # Windows has no signal.pause
+                time.sleep(3600)
     except KeyboardInterrupt:
         print("\nShutting down...")
         sys.exit(exit_code)
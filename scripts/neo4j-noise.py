@@ -33,9 +33,9 @@ Usage:
 import argparse
 import os
 import random
-import string
 import sys
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 
@@ -69,7 +69,7 @@ USER_NAMES = [
     ("mia-sre", "Mia SRE", "mia@acme-corp.com"),
 ]
 
-PR_TITLES = [
+PR_TITLES = (
     "Add caching layer for {component}",
     "Fix memory leak in {component}",
     "Upgrade {dependency} to latest version",
@@ -90,9 +90,9 @@ PR_TITLES = [
     "Fix null pointer exception in {component}",
     "Add error handling to {component}",
     "Implement circuit breaker for {component}",
-]
+)
 
-COMMIT_MESSAGES = [
+COMMIT_MESSAGES = (
     "feat: add {feature}",
     "fix: resolve {issue}",
     "refactor: improve {component}",
@@ -103,13 +103,18 @@ COMMIT_MESSAGES = [
     "style: format {component} code",
     "build: update build configuration",
     "ci: add {component} to pipeline",
-]
+)
+
+# Dependency names referenced in PR titles
+PR_DEPENDENCIES = ("lodash", "jackson", "spring", "django", "react")
+
+SCANNERS = ("KICS", "BLACKDUCK")
 
-COMPONENTS = [
+COMPONENTS = (
     "user handler", "order processor", "payment gateway", "notification service",
     "data validator", "cache layer", "queue consumer", "API endpoint",
     "database connector", "file uploader", "email sender", "webhook handler",
-]
+)
 
 DEPENDENCIES_NOISE = [
     ("jackson-databind", ["2.12.3", "2.13.0", "2.14.1"], "maven"),
@@ -175,12 +180,22 @@ BLACKDUCK_FINDINGS = [
     ("Memory Corruption in jpeg-js", "HIGH", "CWE-787", 7.5, "Upgrade jpeg-js"),
 ]
 
+# Max rows sent per UNWIND query / write transaction
+BATCH_SIZE = 10000
+# Bolt connections kept by the driver; covers the parallel reference-data phases
+MAX_CONNECTION_POOL_SIZE = 16
+
 
 class NoiseGenerator:
     """Generates realistic random security scan data."""
 
     def __init__(self, uri: str, user: str, password: str, seed: int = None):
-        self.driver = GraphDatabase.driver(uri, auth=(user, password))
+        self.driver = GraphDatabase.driver(
+            uri,
+            auth=(user, password),
+            max_connection_pool_size=MAX_CONNECTION_POOL_SIZE,
+            connection_acquisition_timeout=60,
+        )
         if seed is not None:
             random.seed(seed)
         self._verify_connection()
@@ -197,9 +212,44 @@ class NoiseGenerator:
     def close(self):
         self.driver.close()
 
+    def create_indexes(self):
+        """Create indexes on every property used as a MATCH key during generation."""
+        indexes = [
+            "CREATE INDEX noise_pr_number IF NOT EXISTS FOR (p:PullRequest) ON (p.number)",
+            "CREATE INDEX noise_pr_key IF NOT EXISTS FOR (p:PullRequest) ON (p.noise_key)",
+            # Same constraints as neo4j-seed.py, so uniqueness holds whichever script runs first
+            "CREATE CONSTRAINT commit_sha_unique IF NOT EXISTS FOR (c:Commit) REQUIRE c.sha IS UNIQUE",
+            "CREATE CONSTRAINT scan_id_unique IF NOT EXISTS FOR (s:Scan) REQUIRE s.id IS UNIQUE",
+            "CREATE CONSTRAINT vuln_id_unique IF NOT EXISTS FOR (v:Vulnerability) REQUIRE v.id IS UNIQUE",
+            "CREATE CONSTRAINT dep_name_version_unique IF NOT EXISTS FOR (d:Dependency) REQUIRE (d.name, d.version) IS UNIQUE",
+            "CREATE CONSTRAINT user_login_unique IF NOT EXISTS FOR (u:User) REQUIRE u.login IS UNIQUE",
+            "CREATE CONSTRAINT cve_id_unique IF NOT EXISTS FOR (cve:CVE) REQUIRE cve.cve_id IS UNIQUE",
+            "CREATE INDEX noise_file_path IF NOT EXISTS FOR (f:File) ON (f.path)",
+            "CREATE INDEX noise_repo_name IF NOT EXISTS FOR (r:Repository) ON (r.name)",
+            "CREATE INDEX noise_rule_name IF NOT EXISTS FOR (r:Rule) ON (r.name)",
+        ]
+        with self.driver.session() as session:
+            for idx in indexes:
+                try:
+                    session.run(idx).consume()
+                except Exception as e:
+                    # Equivalent index or constraint might already exist
+                    if idx.startswith("CREATE CONSTRAINT"):
+                        print(f"Warning: constraint not created: {e}")
+        print("Created indexes")
+
+    @staticmethod
+    def _unwind(tx, query: str, rows: List[Dict]):
+        tx.run(query, rows=rows).consume()
+
+    def _write_batches(self, session, query: str, rows: List[Dict]):
+        """Run an UNWIND $rows query, one write transaction per BATCH_SIZE rows."""
+        for i in range(0, len(rows), BATCH_SIZE):
+            session.execute_write(self._unwind, query, rows[i:i + BATCH_SIZE])
+
     def _random_sha(self) -> str:
         """Generate a random commit SHA."""
-        return ''.join(random.choices(string.hexdigits.lower(), k=40))
+        return random.randbytes(20).hex()
 
     def _random_date(self, start_year: int = 2022, end_year: int = 2024) -> datetime:
         """Generate a random datetime."""
@@ -211,63 +261,56 @@ class NoiseGenerator:
         random_minutes = random.randint(0, 59)
         return start + timedelta(days=random_days, hours=random_hours, minutes=random_minutes)
 
-    def _random_severity(self) -> str:
-        """Generate weighted random severity."""
-        return random.choices(
-            ["CRITICAL", "HIGH", "MEDIUM", "LOW"],
-            weights=[10, 25, 40, 25]
-        )[0]
-
     def generate_users(self) -> List[Dict]:
         """Generate additional users."""
-        users = []
+        users = [{"login": login, "name": name, "email": email}
+                 for login, name, email in USER_NAMES]
         with self.driver.session() as session:
-            for login, name, email in USER_NAMES:
-                session.run("""
-                    MERGE (u:User {login: $login})
-                    SET u.name = $name, u.email = $email
-                """, login=login, name=name, email=email)
-                users.append({"login": login, "name": name})
+            self._write_batches(session, """
+                UNWIND $rows AS row
+                MERGE (u:User {login: row.login})
+                SET u.name = row.name, u.email = row.email
+            """, users)
         print(f"Created {len(users)} additional users")
-        return users
+        return [{"login": u["login"], "name": u["name"]} for u in users]
 
     def generate_repositories(self, count: int = 10) -> List[str]:
         """Generate additional repositories."""
         repos = random.sample(REPO_NAMES, min(count, len(REPO_NAMES)))
         with self.driver.session() as session:
-            for name in repos:
-                session.run("""
-                    MERGE (r:Repository {name: $name, owner: 'acme-corp'})
-                    SET r.url = 'https://github.com/acme-corp/' + $name,
-                        r.default_branch = 'main'
-                """, name=name)
+            self._write_batches(session, """
+                UNWIND $rows AS row
+                MERGE (r:Repository {name: row.name, owner: 'acme-corp'})
+                SET r.url = 'https://github.com/acme-corp/' + row.name,
+                    r.default_branch = 'main'
+            """, [{"name": name} for name in repos])
         print(f"Created {len(repos)} additional repositories")
         return repos
 
     def generate_files(self) -> List[Dict]:
         """Generate additional files."""
-        files = []
+        files = [{"path": path, "language": language} for path, language in FILES_NOISE]
         with self.driver.session() as session:
-            for path, language in FILES_NOISE:
-                session.run("""
-                    MERGE (f:File {path: $path})
-                    SET f.language = $language
-                """, path=path, language=language)
-                files.append({"path": path, "language": language})
+            self._write_batches(session, """
+                UNWIND $rows AS row
+                MERGE (f:File {path: row.path})
+                SET f.language = row.language
+            """, files)
         print(f"Created {len(files)} additional files")
         return files
 
     def generate_dependencies(self) -> List[Dict]:
         """Generate additional dependencies."""
-        deps = []
+        rows = [{"name": name, "version": version, "ecosystem": ecosystem}
+                for name, versions, ecosystem in DEPENDENCIES_NOISE
+                for version in versions]
         with self.driver.session() as session:
-            for name, versions, ecosystem in DEPENDENCIES_NOISE:
-                for version in versions:
-                    session.run("""
-                        MERGE (d:Dependency {name: $name, version: $version})
-                        SET d.ecosystem = $ecosystem, d.license = 'Apache-2.0'
-                    """, name=name, version=version, ecosystem=ecosystem)
-                    deps.append({"name": name, "version": version})
+            self._write_batches(session, """
+                UNWIND $rows AS row
+                MERGE (d:Dependency {name: row.name, version: row.version})
+                SET d.ecosystem = row.ecosystem, d.license = 'Apache-2.0'
+            """, rows)
+        deps = [{"name": r["name"], "version": r["version"]} for r in rows]
         print(f"Created {len(deps)} additional dependencies")
         return deps
 
@@ -276,6 +319,12 @@ class NoiseGenerator:
         """Generate PRs, commits, scans, and vulnerabilities."""
         stats = {"prs": 0, "commits": 0, "scans": 0, "vulns": 0}
 
+        # Rows collected in memory and written with one UNWIND query per entity type
+        prs_batch = []
+        commits_batch = []
+        scans_batch = []
+        vulns_batch = []
+
         with self.driver.session() as session:
             # Get existing files for linking
             files_result = session.run("MATCH (f:File) RETURN f.path AS path")
@@ -298,8 +347,10 @@ class NoiseGenerator:
                 user = random.choice(users)
                 pr_date = self._random_date()
                 pr_number = random.randint(100, 999)
+                # Numbers repeat within a repo, so commits link by this key
+                pr_key = uuid.uuid4().hex
                 component = random.choice(COMPONENTS)
-                dependency = random.choice(["lodash", "jackson", "spring", "django", "react"])
+                dependency = random.choice(PR_DEPENDENCIES)
 
                 pr_title = random.choice(PR_TITLES).format(
                     component=component,
@@ -311,25 +362,12 @@ class NoiseGenerator:
                 pr_state = "merged" if is_merged else "open"
                 merged_at = (pr_date + timedelta(days=random.randint(1, 5))) if is_merged else None
 
-                # Create PR
-                session.run("""
-                    MATCH (r:Repository {name: $repo})
-                    MATCH (u:User {login: $user})
-                    CREATE (pr:PullRequest {
-                        number: $number,
-                        title: $title,
-                        state: $state,
-                        created_at: datetime($created_at)
-                    })
-                    CREATE (r)-[:HAS_PR]->(pr)
-                    CREATE (pr)-[:OPENED_BY]->(u)
-                    WITH pr
-                    WHERE $merged_at IS NOT NULL
-                    SET pr.merged_at = datetime($merged_at)
-                """, repo=repo, user=user["login"], number=pr_number,
-                     title=pr_title, state=pr_state,
-                     created_at=pr_date.isoformat(),
-                     merged_at=merged_at.isoformat() if merged_at else None)
+                prs_batch.append({
+                    "key": pr_key, "repo": repo, "user": user["login"], "number": pr_number,
+                    "title": pr_title, "state": pr_state,
+                    "created_at": pr_date.isoformat(),
+                    "merged_at": merged_at.isoformat() if merged_at else None,
+                })
                 stats["prs"] += 1
 
                 # Create 1-3 commits per PR
@@ -345,39 +383,23 @@ class NoiseGenerator:
                     )
                     commit_date = commit_date + timedelta(hours=random.randint(1, 8))
 
-                    session.run("""
-                        MATCH (pr:PullRequest {number: $pr_number})
-                              <-[:HAS_PR]-(r:Repository {name: $repo})
-                        CREATE (c:Commit {
-                            sha: $sha,
-                            message: $message,
-                            author: $author,
-                            timestamp: datetime($timestamp)
-                        })
-                        CREATE (pr)-[:CONTAINS_COMMIT]->(c)
-                    """, pr_number=pr_number, repo=repo, sha=commit_sha,
-                         message=commit_msg, author=user["login"],
-                         timestamp=commit_date.isoformat())
+                    commits_batch.append({
+                        "pr_key": pr_key, "sha": commit_sha,
+                        "message": commit_msg, "author": user["login"],
+                        "timestamp": commit_date.isoformat(),
+                    })
                     stats["commits"] += 1
 
                     # Create scan for each commit (70% chance)
                     if random.random() > 0.3:
-                        scanner = random.choice(["KICS", "BLACKDUCK"])
-                        scan_id = f"scan-noise-{uuid.uuid4().hex[:8]}"
-
-                        session.run("""
-                            MATCH (c:Commit {sha: $sha})
-                            CREATE (s:Scan {
-                                id: $scan_id,
-                                scanner: $scanner,
-                                started_at: datetime($started),
-                                completed_at: datetime($completed),
-                                status: 'completed'
-                            })
-                            CREATE (c)-[:SCANNED_BY]->(s)
-                        """, sha=commit_sha, scan_id=scan_id, scanner=scanner,
-                             started=commit_date.isoformat(),
-                             completed=(commit_date + timedelta(minutes=random.randint(2, 15))).isoformat())
+                        scanner = random.choice(SCANNERS)
+                        scan_id = f"scan-noise-{uuid.uuid4().hex[:16]}"
+
+                        scans_batch.append({
+                            "sha": commit_sha, "scan_id": scan_id, "scanner": scanner,
+                            "started": commit_date.isoformat(),
+                            "completed": (commit_date + timedelta(minutes=random.randint(2, 15))).isoformat(),
+                        })
                         stats["scans"] += 1
 
                         # Create 0-3 vulnerabilities per scan (60% chance of having vulns)
@@ -387,61 +409,106 @@ class NoiseGenerator:
 
                             for _ in range(vuln_count):
                                 finding = random.choice(findings)
-                                vuln_id = f"vuln-noise-{uuid.uuid4().hex[:8]}"
-
-                                session.run("""
-                                    MATCH (s:Scan {id: $scan_id})
-                                    CREATE (v:Vulnerability {
-                                        id: $vuln_id,
-                                        severity: $severity,
-                                        title: $title,
-                                        description: $title,
-                                        cwe_id: $cwe,
-                                        cvss_score: $cvss,
-                                        remediation: $remediation
-                                    })
-                                    CREATE (s)-[:DETECTED]->(v)
-                                """, scan_id=scan_id, vuln_id=vuln_id,
-                                     severity=finding[1], title=finding[0],
-                                     cwe=finding[2], cvss=finding[3],
-                                     remediation=finding[4])
+                                vuln_id = f"vuln-noise-{uuid.uuid4().hex[:16]}"
+
+                                vuln = {
+                                    "scan_id": scan_id, "vuln_id": vuln_id,
+                                    "severity": finding[1], "title": finding[0],
+                                    "cwe": finding[2], "cvss": finding[3],
+                                    "remediation": finding[4],
+                                    "file_path": None, "line": None, "rule": None,
+                                    "dep_name": None, "dep_version": None, "cve": None,
+                                }
                                 stats["vulns"] += 1
 
                                 # Link to file (KICS) or dependency (Blackduck)
                                 if scanner == "KICS" and available_files:
-                                    file_path = random.choice(available_files)
-                                    line = random.randint(10, 200)
-                                    session.run("""
-                                        MATCH (v:Vulnerability {id: $vuln_id})
-                                        MATCH (f:File {path: $path})
-                                        CREATE (v)-[:IN_FILE {line: $line}]->(f)
-                                    """, vuln_id=vuln_id, path=file_path, line=line)
+                                    vuln["file_path"] = random.choice(available_files)
+                                    vuln["line"] = random.randint(10, 200)
 
                                     # Link to rule if available
                                     if available_rules:
-                                        rule_name = random.choice(available_rules)
-                                        session.run("""
-                                            MATCH (v:Vulnerability {id: $vuln_id})
-                                            MATCH (r:Rule {name: $rule})
-                                            MERGE (v)-[:VIOLATES]->(r)
-                                        """, vuln_id=vuln_id, rule=rule_name)
+                                        vuln["rule"] = random.choice(available_rules)
 
                                 elif scanner == "BLACKDUCK" and available_deps:
-                                    dep = random.choice(available_deps)
-                                    session.run("""
-                                        MATCH (v:Vulnerability {id: $vuln_id})
-                                        MATCH (d:Dependency {name: $name, version: $version})
-                                        CREATE (v)-[:IN_DEPENDENCY]->(d)
-                                    """, vuln_id=vuln_id, name=dep[0], version=dep[1])
+                                    vuln["dep_name"], vuln["dep_version"] = random.choice(available_deps)
 
                                     # Link to CVE if available (30% chance)
                                     if available_cves and random.random() > 0.7:
-                                        cve_id = random.choice(available_cves)
-                                        session.run("""
-                                            MATCH (v:Vulnerability {id: $vuln_id})
-                                            MATCH (c:CVE {cve_id: $cve})
-                                            MERGE (v)-[:MAPS_TO]->(c)
-                                        """, vuln_id=vuln_id, cve=cve_id)
+                                        vuln["cve"] = random.choice(available_cves)
+
+                                vulns_batch.append(vuln)
+
+            self._write_batches(session, """
+                UNWIND $rows AS row
+                MATCH (r:Repository {name: row.repo})
+                MATCH (u:User {login: row.user})
+                CREATE (pr:PullRequest {
+                    noise_key: row.key,
+                    number: row.number,
+                    title: row.title,
+                    state: row.state,
+                    created_at: datetime(row.created_at)
+                })
+                CREATE (r)-[:HAS_PR]->(pr)
+                CREATE (pr)-[:OPENED_BY]->(u)
+                FOREACH (_ IN CASE WHEN row.merged_at IS NULL THEN [] ELSE [1] END |
+                    SET pr.merged_at = datetime(row.merged_at))
+            """, prs_batch)
+
+            self._write_batches(session, """
+                UNWIND $rows AS row
+                MATCH (pr:PullRequest {noise_key: row.pr_key})
+                CREATE (c:Commit {
+                    sha: row.sha,
+                    message: row.message,
+                    author: row.author,
+                    timestamp: datetime(row.timestamp)
+                })
+                CREATE (pr)-[:CONTAINS_COMMIT]->(c)
+            """, commits_batch)
+
+            self._write_batches(session, """
+                UNWIND $rows AS row
+                MATCH (c:Commit {sha: row.sha})
+                CREATE (s:Scan {
+                    id: row.scan_id,
+                    scanner: row.scanner,
+                    started_at: datetime(row.started),
+                    completed_at: datetime(row.completed),
+                    status: 'completed'
+                })
+                CREATE (c)-[:SCANNED_BY]->(s)
+            """, scans_batch)
+
+            # Vulnerabilities and their file/rule/dependency/CVE links in one pass
+            self._write_batches(session, """
+                UNWIND $rows AS row
+                MATCH (s:Scan {id: row.scan_id})
+                CREATE (v:Vulnerability {
+                    id: row.vuln_id,
+                    severity: row.severity,
+                    title: row.title,
+                    description: row.title,
+                    cwe_id: row.cwe,
+                    cvss_score: row.cvss,
+                    remediation: row.remediation
+                })
+                CREATE (s)-[:DETECTED]->(v)
+                WITH v, row
+                OPTIONAL MATCH (f:File {path: row.file_path})
+                OPTIONAL MATCH (ru:Rule {name: row.rule})
+                OPTIONAL MATCH (d:Dependency {name: row.dep_name, version: row.dep_version})
+                OPTIONAL MATCH (c:CVE {cve_id: row.cve})
+                FOREACH (_ IN CASE WHEN f IS NULL THEN [] ELSE [1] END |
+                    CREATE (v)-[:IN_FILE {line: row.line}]->(f))
+                FOREACH (_ IN CASE WHEN ru IS NULL THEN [] ELSE [1] END |
+                    MERGE (v)-[:VIOLATES]->(ru))
+                FOREACH (_ IN CASE WHEN d IS NULL THEN [] ELSE [1] END |
+                    CREATE (v)-[:IN_DEPENDENCY]->(d))
+                FOREACH (_ IN CASE WHEN c IS NULL THEN [] ELSE [1] END |
+                    MERGE (v)-[:MAPS_TO]->(c))
+            """, vulns_batch)
 
         print(f"Created {stats['prs']} PRs, {stats['commits']} commits, "
             f"{stats['scans']} scans, {stats['vulns']} vulnerabilities")
@@ -481,10 +548,17 @@ class NoiseGenerator:
         print("GENERATING NOISE DATA")
         print("="*50 + "\n")
 
-        users = self.generate_users()
-        repos = self.generate_repositories(count=10)
-        self.generate_files()
-        self.generate_dependencies()
+        self.create_indexes()
+        # Reference data phases touch disjoint labels, so run them side by side
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            users_future = executor.submit(self.generate_users)
+            repos_future = executor.submit(self.generate_repositories, count=10)
+            files_future = executor.submit(self.generate_files)
+            deps_future = executor.submit(self.generate_dependencies)
+            users = users_future.result()
+            repos = repos_future.result()
+            files_future.result()
+            deps_future.result()
         self.generate_prs_with_scans(repos, users, pr_count=pr_count)
         self.print_stats()
 
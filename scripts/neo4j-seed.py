@@ -46,9 +46,13 @@ import argparse
 import os
 import sys
 import random
+import re
 import string
-import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, date, timedelta
+from itertools import accumulate, islice
 from typing import Optional
 
 try:
@@ -57,32 +61,274 @@ except ImportError:
     print("Error: neo4j package not installed. Run: pip install neo4j")
     sys.exit(1)
 
+# Rows per explicit write transaction
+BATCH_SIZE = 1000
+# Nodes deleted per transaction by clear_database
+CLEAR_BATCH_SIZE = 10000
+
+INDEX_NAME_RE = re.compile(r"CREATE (?:CONSTRAINT|INDEX) (\S+)")
+
+# Bolt driver defaults, overridable with --pool-size / --acquire-timeout
+DEFAULT_POOL_SIZE = 64
+DEFAULT_ACQUIRE_TIMEOUT = 120
+
+DEFAULT_DATABASE = "neo4j"
+
+# seed_noise upserts per row kind. Write order matters: each query matches
+# nodes created by the ones above it.
+NOISE_QUERIES = {
+    "repo": """
+        UNWIND $rows AS row
+        MERGE (r:Repository {owner: row.owner, name: row.name})
+        SET r.full_name = row.full_name,
+            r.language = row.language,
+            r.created_at = row.created_at,
+            r.is_noise = true
+    """,
+    "file": """
+        UNWIND $rows AS row
+        MATCH (r:Repository {owner: row.owner, name: row.name})
+        MERGE (f:File {path: row.path, repository: row.repo_id})
+        SET f.type = row.type, f.is_noise = true
+        MERGE (r)-[:CONTAINS_FILE]->(f)
+    """,
+    "pr": """
+        UNWIND $rows AS row
+        MATCH (r:Repository {owner: row.owner, name: row.name})
+        MERGE (pr:PullRequest {repo: row.repo_id, number: row.pr_num})
+        SET pr.title = row.title,
+            pr.created_at = row.created_at,
+            pr.merged_at = row.merged_at,
+            pr.is_noise = true
+        MERGE (r)-[:HAS_PR]->(pr)
+    """,
+    "commit": """
+        UNWIND $rows AS row
+        MATCH (pr:PullRequest {repo: row.repo_id, number: row.pr_num})
+        MERGE (c:Commit {sha: row.sha})
+        SET c.message = row.message,
+            c.created_at = row.created_at,
+            c.is_noise = true
+        MERGE (pr)-[:CONTAINS_COMMIT]->(c)
+    """,
+    "scan": """
+        UNWIND $rows AS row
+        MATCH (c:Commit {sha: row.sha})
+        MERGE (s:Scan {scan_id: row.scan_id})
+        SET s.scanner = row.scanner,
+            s.started_at = row.started_at,
+            s.completed_at = row.completed_at,
+            s.status = 'completed',
+            s.is_noise = true
+        MERGE (c)-[:SCANNED_BY]->(s)
+    """,
+    "vuln": """
+        UNWIND $rows AS row
+        MATCH (s:Scan {scan_id: row.scan_id})
+        MERGE (v:Vulnerability {vuln_id: row.vuln_id})
+        SET v.severity = row.severity,
+            v.title = row.title,
+            v.description = row.description,
+            v.is_noise = true
+        MERGE (s)-[:DETECTED]->(v)
+    """,
+}
+
+# With APOC, files and PRs are written without their repository edge; the
+# edges are then derived server-side from f.repository / pr.repo.
+NOISE_APOC_NODE_QUERIES = {
+    "file": """
+        UNWIND $rows AS row
+        MERGE (f:File {path: row.path, repository: row.repo_id})
+        SET f.type = row.type, f.is_noise = true
+    """,
+    "pr": """
+        UNWIND $rows AS row
+        MERGE (pr:PullRequest {repo: row.repo_id, number: row.pr_num})
+        SET pr.title = row.title,
+            pr.created_at = row.created_at,
+            pr.merged_at = row.merged_at,
+            pr.is_noise = true
+    """,
+}
+NOISE_APOC_EDGES = [
+    (
+        "MATCH (f:File) WHERE f.is_noise AND NOT (f)<-[:CONTAINS_FILE]-() RETURN f",
+        "MATCH (r:Repository {full_name: f.repository}) CREATE (r)-[:CONTAINS_FILE]->(f)",
+    ),
+    (
+        "MATCH (pr:PullRequest) WHERE pr.is_noise AND NOT (pr)<-[:HAS_PR]-() RETURN pr",
+        "MATCH (r:Repository {full_name: pr.repo}) CREATE (r)-[:HAS_PR]->(pr)",
+    ),
+]
+
+
+def _compact(query: str) -> str:
+    """Collapse whitespace so the query text, and with it the plan cache key, is stable."""
+    return " ".join(query.split())
+
+
+# Demo queries shown by run_demo_queries
+DEMO_QUERY_INTRODUCED = _compact("""
+    MATCH (r:Repository)-[:HAS_PR]->(pr:PullRequest)
+          -[:CONTAINS_COMMIT]->(c:Commit)
+          -[:SCANNED_BY]->(s:Scan)
+          -[:DETECTED]->(v:Vulnerability)
+          -[:MAPS_TO]->(cve:CVE {cve_id: $cve_id})
+    RETURN r.owner + '/' + r.name AS repository,
+           pr.number AS pr_number,
+           pr.title AS pr_title,
+           pr.created_at AS introduced_date
+    ORDER BY pr.created_at
+""")
+
+DEMO_QUERY_TRANSITIVE = _compact("""
+    MATCH path = (r:Repository)-[:HAS_DEPENDENCY]->(d1:Dependency)
+          -[:DEPENDS_ON*1..3]->(d2:Dependency)-[:HAS_CVE]->(cve:CVE)
+    RETURN r.name AS repository,
+           d1.name + '@' + d1.version AS direct_dep,
+           d2.name + '@' + d2.version AS vuln_dep,
+           cve.cve_id AS cve_id,
+           cve.cvss_score AS cvss_score
+    ORDER BY cve.cvss_score DESC
+    LIMIT 5
+""")
+
+DEMO_QUERY_COMMON = _compact("""
+    MATCH (r:Repository)-[:HAS_PR]->(:PullRequest)
+          -[:CONTAINS_COMMIT]->(:Commit)
+          -[:SCANNED_BY]->(:Scan)
+          -[:DETECTED]->(v:Vulnerability)
+          -[:MAPS_TO]->(cve:CVE)
+    WITH cve, collect(DISTINCT r.name) AS affected_repos, count(DISTINCT r) AS repo_count
+    WHERE repo_count > 1
+    RETURN cve.cve_id AS cve_id, cve.cvss_score AS cvss_score, repo_count, affected_repos
+    ORDER BY repo_count DESC, cve.cvss_score DESC
+""")
+
+# Scans that still see the CVE are collected once up front for the anti-join
+DEMO_QUERY_LINEAGE = _compact("""
+    OPTIONAL MATCH (:CVE {cve_id: $cve_id})<-[:MAPS_TO]-(:Vulnerability)<-[:DETECTED]-(bad:Scan)
+    WITH collect(DISTINCT bad) AS still_vulnerable
+    MATCH (r:Repository {name: $repo})-[:HAS_PR]->(pr1:PullRequest)
+          -[:CONTAINS_COMMIT]->(c1:Commit)
+          -[:SCANNED_BY]->(:Scan)
+          -[:DETECTED]->(v:Vulnerability)
+          -[:MAPS_TO]->(cve:CVE {cve_id: $cve_id})
+    OPTIONAL MATCH (r)-[:HAS_PR]->(pr2:PullRequest)
+          -[:CONTAINS_COMMIT]->(c2:Commit)
+          -[:SCANNED_BY]->(s2:Scan)
+    WHERE pr2.created_at > pr1.created_at
+      AND s2.scanner = $scanner
+      AND NOT s2 IN still_vulnerable
+    WITH pr1, v, cve, pr2
+    ORDER BY pr2.created_at
+    WITH pr1, v, cve, collect(pr2)[0] AS fixing_pr
+    RETURN pr1.number AS introduced_pr,
+           pr1.created_at AS introduced_date,
+           fixing_pr.number AS fixed_pr,
+           fixing_pr.merged_at AS fixed_date,
+           duration.between(pr1.created_at, fixing_pr.merged_at).days AS days_to_fix
+""")
+
 
 class SecurityGraphSeeder:
     """Seeds Neo4j with security scan demo data."""
 
-    def __init__(self, uri: str, user: str, password: str):
-        self.driver = GraphDatabase.driver(uri, auth=(user, password))
-        self._verify_connection()
+    def __init__(self, uri: str, user: str, password: str,
+                 pool_size: int = DEFAULT_POOL_SIZE, acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT,
+                 database: str = DEFAULT_DATABASE, verify: bool = True):
+        self.driver = GraphDatabase.driver(
+            uri,
+            auth=(user, password),
+            max_connection_pool_size=pool_size,
+            connection_acquisition_timeout=acquire_timeout,
+            max_transaction_retry_time=60,
+            connection_timeout=30,
+            max_connection_lifetime=3600,
+            keep_alive=True,
+        )
+        self.database = database
+        self._indices_verified = False
+        # Element ids of created reference nodes, keyed by their natural key
+        self._cve_ids = {}
+        self._dep_ids = {}
+        self._rule_ids = {}
+        self._repo_ids = {}
+        self._file_ids = {}
+        self._user_ids = {}
+        # One long-lived session per thread, closed together in close()
+        self._local = threading.local()
+        self._sessions = []
+        if verify:
+            self._verify_connection()
 
     def _verify_connection(self):
         """Verify Neo4j connection."""
         try:
-            with self.driver.session() as session:
+            with self._session() as session:
                 session.run("RETURN 1")
             print("Connected to Neo4j successfully")
         except Exception as e:
             print(f"Failed to connect to Neo4j: {e}")
             sys.exit(1)
 
+    @contextmanager
+    def _session(self):
+        """Yield the calling thread's session, opening it on first use. It stays open."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self.driver.session(database=self.database)
+            self._sessions.append(session)
+        yield session
+
     def close(self):
-        """Close the driver connection."""
+        """Close open sessions and the driver connection."""
+        for session in self._sessions:
+            session.close()
         self.driver.close()
 
+    @staticmethod
+    def _unwind(tx, query: str, rows: list):
+        tx.run(query, rows=rows).consume()
+
+    def _run_batched(self, session, query: str, rows: list, batch: int = BATCH_SIZE):
+        """Run an UNWIND $rows query in explicit write transactions of `batch` rows."""
+        for i in range(0, len(rows), batch):
+            session.execute_write(self._unwind, query, rows[i:i + batch])
+
+    @staticmethod
+    def _unwind_ids(tx, query: str, rows: list) -> dict:
+        ids = {}
+        for record in tx.run(query, rows=rows):
+            key = record["key"]
+            # Composite keys come back as lists; make them usable as dict keys
+            ids[tuple(key) if isinstance(key, list) else key] = record["id"]
+        return ids
+
+    def _create_batched(self, session, query: str, rows: list, batch: int = BATCH_SIZE) -> dict:
+        """Like _run_batched for queries that RETURN ... AS key, elementId(n) AS id."""
+        ids = {}
+        for i in range(0, len(rows), batch):
+            ids.update(session.execute_write(self._unwind_ids, query, rows[i:i + batch]))
+        return ids
+
     def clear_database(self):
         """Remove all existing data."""
-        with self.driver.session() as session:
-            session.run("MATCH (n) DETACH DELETE n")
+        with self._session() as session:
+            version = session.run(
+                "CALL dbms.components() YIELD versions RETURN versions[0] AS version"
+            ).single()["version"]
+            major, minor = (int(part) for part in version.split(".")[:2])
+            if (major, minor) >= (4, 4):
+                # Delete in bounded transactions so large noise graphs don't hold every lock at once
+                session.run(f"""
+                    MATCH (n)
+                    CALL {{ WITH n DETACH DELETE n }} IN TRANSACTIONS OF {CLEAR_BATCH_SIZE} ROWS
+                """).consume()
+            else:
+                session.run("MATCH (n) DETACH DELETE n").consume()
+        self._indices_verified = False
         print("Cleared existing data")
 
     def create_indexes(self):
@@ -94,14 +340,42 @@ class SecurityGraphSeeder:
             "CREATE INDEX vuln_severity IF NOT EXISTS FOR (v:Vulnerability) ON (v.severity)",
             "CREATE INDEX dep_name IF NOT EXISTS FOR (d:Dependency) ON (d.name)",
             "CREATE INDEX scan_scanner IF NOT EXISTS FOR (s:Scan) ON (s.scanner)",
+            # Keys looked up by MATCH while linking PRs, scans and vulnerabilities
+            "CREATE CONSTRAINT dep_name_version_unique IF NOT EXISTS FOR (d:Dependency) REQUIRE (d.name, d.version) IS UNIQUE",
+            "CREATE CONSTRAINT user_login_unique IF NOT EXISTS FOR (u:User) REQUIRE u.login IS UNIQUE",
+            "CREATE CONSTRAINT scan_id_unique IF NOT EXISTS FOR (s:Scan) REQUIRE s.id IS UNIQUE",
+            "CREATE CONSTRAINT vuln_id_unique IF NOT EXISTS FOR (v:Vulnerability) REQUIRE v.id IS UNIQUE",
+            # Noise data reuses file paths across repositories, so no uniqueness here
+            "CREATE INDEX file_path IF NOT EXISTS FOR (f:File) ON (f.path)",
+            "CREATE INDEX rule_name IF NOT EXISTS FOR (r:Rule) ON (r.name)",
+            "CREATE INDEX repo_name IF NOT EXISTS FOR (r:Repository) ON (r.name)",
+            "CREATE INDEX pr_number IF NOT EXISTS FOR (pr:PullRequest) ON (pr.number)",
+            "CREATE INDEX repo_full_name IF NOT EXISTS FOR (r:Repository) ON (r.full_name)",
+            # MERGE keys used by seed_noise; composite where the MERGE matches on two properties
+            "CREATE INDEX seed_noise_file_path_repo IF NOT EXISTS FOR (f:File) ON (f.path, f.repository)",
+            "CREATE INDEX seed_noise_pr_repo_number IF NOT EXISTS FOR (pr:PullRequest) ON (pr.repo, pr.number)",
+            "CREATE INDEX seed_noise_scan_id IF NOT EXISTS FOR (s:Scan) ON (s.scan_id)",
+            "CREATE INDEX seed_noise_vuln_id IF NOT EXISTS FOR (v:Vulnerability) ON (v.vuln_id)",
         ]
-        with self.driver.session() as session:
+        if self._indices_verified:
+            return
+
+        expected = {INDEX_NAME_RE.match(idx).group(1) for idx in indexes}
+        with self._session() as session:
+            existing = {record["name"] for record in session.run("SHOW INDEXES YIELD name")}
+            if expected <= existing:
+                self._indices_verified = True
+                print("Indexes already present")
+                return
+
             for idx in indexes:
                 try:
-                    session.run(idx)
+                    session.run(idx).consume()
                 except Exception as e:
                     # Index might already exist
-                    pass
+                    if idx.startswith("CREATE CONSTRAINT"):
+                        print(f"Warning: constraint not created: {e}")
+        self._indices_verified = True
         print("Created indexes")
 
     def seed_cves(self):
@@ -115,16 +389,15 @@ class SecurityGraphSeeder:
             {"cve_id": "CVE-2023-44487", "published": "2023-10-10", "cvss": 7.5, "desc": "HTTP/2 Rapid Reset Attack"},
             {"cve_id": "CVE-2024-3094", "published": "2024-03-29", "cvss": 10.0, "desc": "XZ Utils Backdoor"},
         ]
-        with self.driver.session() as session:
-            for cve in cves:
-                session.run("""
-                    CREATE (c:CVE {
-                        cve_id: $cve_id,
-                        published_at: date($published),
-                        cvss_score: $cvss,
-                        description: $desc
-                    })
-                """, cve_id=cve["cve_id"], published=cve["published"], cvss=cve["cvss"], desc=cve["desc"])
+        with self._session() as session:
+            self._cve_ids = self._create_batched(session, """
+                UNWIND $rows AS row
+                MERGE (c:CVE {cve_id: row.cve_id})
+                SET c.published_at = date(row.published),
+                    c.cvss_score = row.cvss,
+                    c.description = row.desc
+                RETURN c.cve_id AS key, elementId(c) AS id
+            """, cves)
         print(f"Created {len(cves)} CVEs")
 
     def seed_dependencies(self):
@@ -149,16 +422,14 @@ class SecurityGraphSeeder:
             {"name": "commons-text", "version": "1.10.0", "ecosystem": "maven", "license": "Apache-2.0"},
         ]
 
-        with self.driver.session() as session:
-            for dep in dependencies:
-                session.run("""
-                    CREATE (d:Dependency {
-                        name: $name,
-                        version: $version,
-                        ecosystem: $ecosystem,
-                        license: $license
-                    })
-                """, **dep)
+        with self._session() as session:
+            self._dep_ids = self._create_batched(session, """
+                UNWIND $rows AS row
+                MERGE (d:Dependency {name: row.name, version: row.version})
+                SET d.ecosystem = row.ecosystem,
+                    d.license = row.license
+                RETURN [d.name, d.version] AS key, elementId(d) AS id
+            """, dependencies)
 
             # Transitive dependencies
             transitive = [
@@ -169,12 +440,15 @@ class SecurityGraphSeeder:
                 ("express", "4.17.1", "lodash", "4.17.20"),
                 ("requests", "2.25.1", "urllib3", "1.26.4"),
             ]
-            for parent_name, parent_ver, child_name, child_ver in transitive:
-                session.run("""
-                    MATCH (p:Dependency {name: $pname, version: $pver})
-                    MATCH (c:Dependency {name: $cname, version: $cver})
-                    CREATE (p)-[:DEPENDS_ON]->(c)
-                """, pname=parent_name, pver=parent_ver, cname=child_name, cver=child_ver)
+            self._run_batched(session, """
+                UNWIND $rows AS row
+                MATCH (p:Dependency) WHERE elementId(p) = row.a
+                MATCH (c:Dependency) WHERE elementId(c) = row.b
+                MERGE (p)-[:DEPENDS_ON]->(c)
+            """, [
+                {"a": self._dep_ids[(pname, pver)], "b": self._dep_ids[(cname, cver)]}
+                for pname, pver, cname, cver in transitive
+            ])
 
             # CVE links
             cve_links = [
@@ -183,12 +457,15 @@ class SecurityGraphSeeder:
                 ("spring-core", "5.3.18", "CVE-2022-22965"),
                 ("commons-text", "1.9", "CVE-2022-42889"),
             ]
-            for dep_name, dep_ver, cve_id in cve_links:
-                session.run("""
-                    MATCH (d:Dependency {name: $name, version: $ver})
-                    MATCH (c:CVE {cve_id: $cve})
-                    CREATE (d)-[:HAS_CVE]->(c)
-                """, name=dep_name, ver=dep_ver, cve=cve_id)
+            self._run_batched(session, """
+                UNWIND $rows AS row
+                MATCH (d:Dependency) WHERE elementId(d) = row.a
+                MATCH (c:CVE) WHERE elementId(c) = row.b
+                MERGE (d)-[:HAS_CVE]->(c)
+            """, [
+                {"a": self._dep_ids[(name, ver)], "b": self._cve_ids[cve]}
+                for name, ver, cve in cve_links
+            ])
 
         print(f"Created {len(dependencies)} dependencies with relationships")
 
@@ -204,17 +481,16 @@ class SecurityGraphSeeder:
             {"rule_id": "g3d45e67-8f90-4b12-c345-de678f901234", "name": "RDS Publicly Accessible", "category": "Networking", "severity": "HIGH"},
             {"rule_id": "h4e56f78-9012-4c23-d456-ef789a012345", "name": "CloudTrail Disabled", "category": "Logging", "severity": "MEDIUM"},
         ]
-        with self.driver.session() as session:
-            for rule in rules:
-                session.run("""
-                    CREATE (r:Rule {
-                        rule_id: $rule_id,
-                        name: $name,
-                        scanner: 'KICS',
-                        category: $category,
-                        severity: $severity
-                    })
-                """, **rule)
+        with self._session() as session:
+            self._rule_ids = self._create_batched(session, """
+                UNWIND $rows AS row
+                MERGE (r:Rule {rule_id: row.rule_id})
+                SET r.name = row.name,
+                    r.scanner = 'KICS',
+                    r.category = row.category,
+                    r.severity = row.severity
+                RETURN r.name AS key, elementId(r) AS id
+            """, rules)
         print(f"Created {len(rules)} KICS rules")
 
     def seed_repositories(self):
@@ -227,16 +503,14 @@ class SecurityGraphSeeder:
             {"name": "analytics-dashboard", "owner": "acme-corp"},
             {"name": "shared-infra", "owner": "acme-corp"},
         ]
-        with self.driver.session() as session:
-            for repo in repos:
-                session.run("""
-                    CREATE (r:Repository {
-                        name: $name,
-                        owner: $owner,
-                        url: 'https://github.com/' + $owner + '/' + $name,
-                        default_branch: 'main'
-                    })
-                """, **repo)
+        with self._session() as session:
+            self._repo_ids = self._create_batched(session, """
+                UNWIND $rows AS row
+                MERGE (r:Repository {owner: row.owner, name: row.name})
+                SET r.url = 'https://github.com/' + row.owner + '/' + row.name,
+                    r.default_branch = 'main'
+                RETURN r.name AS key, elementId(r) AS id
+            """, repos)
 
             # Link repos to dependencies
             repo_deps = [
@@ -249,12 +523,15 @@ class SecurityGraphSeeder:
                 ("analytics-dashboard", "commons-text", "1.9"),
                 ("shared-infra", "flask", "2.0.1"),
             ]
-            for repo_name, dep_name, dep_ver in repo_deps:
-                session.run("""
-                    MATCH (r:Repository {name: $repo})
-                    MATCH (d:Dependency {name: $dep, version: $ver})
-                    CREATE (r)-[:HAS_DEPENDENCY]->(d)
-                """, repo=repo_name, dep=dep_name, ver=dep_ver)
+            self._run_batched(session, """
+                UNWIND $rows AS row
+                MATCH (r:Repository) WHERE elementId(r) = row.a
+                MATCH (d:Dependency) WHERE elementId(d) = row.b
+                MERGE (r)-[:HAS_DEPENDENCY]->(d)
+            """, [
+                {"a": self._repo_ids[repo], "b": self._dep_ids[(dep, ver)]}
+                for repo, dep, ver in repo_deps
+            ])
 
         print(f"Created {len(repos)} repositories")
 
@@ -276,11 +553,13 @@ class SecurityGraphSeeder:
             {"path": ".github/workflows/ci.yaml", "language": "yaml"},
             {"path": "infra/cloudformation/main.yaml", "language": "yaml"},
         ]
-        with self.driver.session() as session:
-            for f in files:
-                session.run("""
-                    CREATE (f:File {path: $path, language: $language})
-                """, **f)
+        with self._session() as session:
+            self._file_ids = self._create_batched(session, """
+                UNWIND $rows AS row
+                MERGE (f:File {path: row.path})
+                SET f.language = row.language
+                RETURN f.path AS key, elementId(f) AS id
+            """, files)
         print(f"Created {len(files)} files")
 
     def seed_users(self):
@@ -292,710 +571,507 @@ class SecurityGraphSeeder:
             {"login": "diana-lead", "email": "diana@acme-corp.com", "name": "Diana Tech Lead"},
             {"login": "eve-junior", "email": "eve@acme-corp.com", "name": "Eve Junior Dev"},
         ]
-        with self.driver.session() as session:
-            for user in users:
-                session.run("""
-                    CREATE (u:User {login: $login, email: $email, name: $name})
-                """, **user)
+        with self._session() as session:
+            self._user_ids = self._create_batched(session, """
+                UNWIND $rows AS row
+                MERGE (u:User {login: row.login})
+                SET u.email = row.email, u.name = row.name
+                RETURN u.login AS key, elementId(u) AS id
+            """, users)
         print(f"Created {len(users)} users")
 
     def seed_prs_and_scans(self):
         """Create PRs, Commits, Scans, and Vulnerabilities."""
-        with self.driver.session() as session:
-            # ================================================================
-            # PAYMENT-SERVICE: Shows vulnerability lineage (introduced -> fixed)
-            # ================================================================
-
+        # payment-service shows vulnerability lineage (introduced -> fixed),
+        # Log4Shell recurs across repos, shared-infra carries the KICS findings.
+        prs = [
             # PR #101 - Introduces Log4Shell
-            session.run("""
-                MATCH (repo:Repository {name: 'payment-service'})
-                MATCH (user:User {login: 'eve-junior'})
-                MATCH (cve:CVE {cve_id: 'CVE-2021-44228'})
-                MATCH (dep:Dependency {name: 'log4j-core', version: '2.14.1'})
-
-                CREATE (pr:PullRequest {
-                    number: 101,
-                    title: 'Add logging framework for payment transactions',
-                    state: 'merged',
-                    created_at: datetime('2021-11-15T10:00:00Z'),
-                    merged_at: datetime('2021-11-16T14:00:00Z')
-                })
-                CREATE (repo)-[:HAS_PR]->(pr)
-                CREATE (pr)-[:OPENED_BY]->(user)
-
-                CREATE (c:Commit {
-                    sha: 'a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f60101',
-                    message: 'Add log4j dependency for structured logging',
-                    author: 'eve-junior',
-                    timestamp: datetime('2021-11-15T10:30:00Z')
-                })
-                CREATE (pr)-[:CONTAINS_COMMIT]->(c)
-
-                CREATE (scan:Scan {
-                    id: 'scan-ps-101-bd',
-                    scanner: 'BLACKDUCK',
-                    started_at: datetime('2021-11-15T10:35:00Z'),
-                    completed_at: datetime('2021-11-15T10:40:00Z'),
-                    status: 'completed'
-                })
-                CREATE (c)-[:SCANNED_BY]->(scan)
-
-                CREATE (v:Vulnerability {
-                    id: 'vuln-ps-101-001',
-                    severity: 'CRITICAL',
-                    title: 'Log4Shell RCE in log4j-core',
-                    description: 'Remote code execution via JNDI lookup',
-                    cwe_id: 'CWE-502',
-                    cvss_score: 10.0,
-                    remediation: 'Upgrade to log4j-core 2.17.1 or later'
-                })
-                CREATE (scan)-[:DETECTED]->(v)
-                CREATE (v)-[:IN_DEPENDENCY]->(dep)
-                CREATE (v)-[:MAPS_TO]->(cve)
-            """)
-
+            {
+                "repo": "payment-service", "user": "eve-junior", "number": 101, "state": "merged",
+                "title": "Add logging framework for payment transactions",
+                "created_at": "2021-11-15T10:00:00Z", "merged_at": "2021-11-16T14:00:00Z",
+            },
             # PR #115 - Fixes Log4Shell
-            session.run("""
-                MATCH (repo:Repository {name: 'payment-service'})
-                MATCH (user:User {login: 'bob-sec'})
-
-                CREATE (pr:PullRequest {
-                    number: 115,
-                    title: 'SECURITY: Upgrade log4j to fix CVE-2021-44228',
-                    state: 'merged',
-                    created_at: datetime('2021-12-13T08:00:00Z'),
-                    merged_at: datetime('2021-12-13T09:30:00Z')
-                })
-                CREATE (repo)-[:HAS_PR]->(pr)
-                CREATE (pr)-[:OPENED_BY]->(user)
-
-                CREATE (c:Commit {
-                    sha: 'b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f60115',
-                    message: 'Upgrade log4j-core to 2.17.1',
-                    author: 'bob-sec',
-                    timestamp: datetime('2021-12-13T08:30:00Z')
-                })
-                CREATE (pr)-[:CONTAINS_COMMIT]->(c)
-
-                CREATE (scan:Scan {
-                    id: 'scan-ps-115-bd',
-                    scanner: 'BLACKDUCK',
-                    started_at: datetime('2021-12-13T08:35:00Z'),
-                    completed_at: datetime('2021-12-13T08:40:00Z'),
-                    status: 'completed'
-                })
-                CREATE (c)-[:SCANNED_BY]->(scan)
-            """)
-
+            {
+                "repo": "payment-service", "user": "bob-sec", "number": 115, "state": "merged",
+                "title": "SECURITY: Upgrade log4j to fix CVE-2021-44228",
+                "created_at": "2021-12-13T08:00:00Z", "merged_at": "2021-12-13T09:30:00Z",
+            },
             # PR #120 - Adds infrastructure with KICS issues
-            session.run("""
-                MATCH (repo:Repository {name: 'payment-service'})
-                MATCH (user:User {login: 'charlie-ops'})
-                MATCH (f_s3:File {path: 'infra/terraform/s3.tf'})
-                MATCH (f_sg:File {path: 'infra/terraform/security-groups.tf'})
-                MATCH (rule_s3:Rule {name: 'S3 Bucket SSE Disabled'})
-                MATCH (rule_sg:Rule {name: 'Security Group Unrestricted Ingress'})
-
-                CREATE (pr:PullRequest {
-                    number: 120,
-                    title: 'Add Terraform for payment service infrastructure',
-                    state: 'merged',
-                    created_at: datetime('2022-01-10T09:00:00Z'),
-                    merged_at: datetime('2022-01-11T16:00:00Z')
-                })
-                CREATE (repo)-[:HAS_PR]->(pr)
-                CREATE (pr)-[:OPENED_BY]->(user)
-
-                CREATE (c1:Commit {
-                    sha: 'c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f60120a',
-                    message: 'Add S3 bucket for payment receipts',
-                    author: 'charlie-ops',
-                    timestamp: datetime('2022-01-10T09:30:00Z')
-                })
-                CREATE (c2:Commit {
-                    sha: 'c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f60120b',
-                    message: 'Add security groups for payment API',
-                    author: 'charlie-ops',
-                    timestamp: datetime('2022-01-10T14:00:00Z')
-                })
-                CREATE (pr)-[:CONTAINS_COMMIT]->(c1)
-                CREATE (pr)-[:CONTAINS_COMMIT]->(c2)
-
-                CREATE (scan1:Scan {
-                    id: 'scan-ps-120a-kics',
-                    scanner: 'KICS',
-                    started_at: datetime('2022-01-10T09:35:00Z'),
-                    completed_at: datetime('2022-01-10T09:38:00Z'),
-                    status: 'completed'
-                })
-                CREATE (c1)-[:SCANNED_BY]->(scan1)
-                CREATE (c1)-[:MODIFIES]->(f_s3)
-
-                CREATE (v1:Vulnerability {
-                    id: 'vuln-ps-120-001',
-                    severity: 'HIGH',
-                    title: 'S3 Bucket Without Server-Side Encryption',
-                    description: 'Payment receipts bucket does not have encryption enabled',
-                    cwe_id: 'CWE-311',
-                    cvss_score: 7.5,
-                    remediation: 'Enable SSE-S3 or SSE-KMS encryption'
-                })
-                CREATE (scan1)-[:DETECTED]->(v1)
-                CREATE (v1)-[:IN_FILE {line: 15, column: 1}]->(f_s3)
-                CREATE (v1)-[:VIOLATES]->(rule_s3)
-                CREATE (scan1)-[:USED_RULE]->(rule_s3)
-
-                CREATE (scan2:Scan {
-                    id: 'scan-ps-120b-kics',
-                    scanner: 'KICS',
-                    started_at: datetime('2022-01-10T14:05:00Z'),
-                    completed_at: datetime('2022-01-10T14:08:00Z'),
-                    status: 'completed'
-                })
-                CREATE (c2)-[:SCANNED_BY]->(scan2)
-                CREATE (c2)-[:MODIFIES]->(f_sg)
-
-                CREATE (v2:Vulnerability {
-                    id: 'vuln-ps-120-002',
-                    severity: 'CRITICAL',
-                    title: 'Security Group Allows Unrestricted Ingress on Port 22',
-                    description: 'SSH port open to 0.0.0.0/0',
-                    cwe_id: 'CWE-284',
-                    cvss_score: 9.1,
-                    remediation: 'Restrict ingress to specific IP ranges'
-                })
-                CREATE (scan2)-[:DETECTED]->(v2)
-                CREATE (v2)-[:IN_FILE {line: 28, column: 5}]->(f_sg)
-                CREATE (v2)-[:VIOLATES]->(rule_sg)
-                CREATE (scan2)-[:USED_RULE]->(rule_sg)
-            """)
-
-            # ================================================================
-            # USER-API: Also has Log4Shell (common vuln across repos)
-            # ================================================================
-
-            session.run("""
-                MATCH (repo:Repository {name: 'user-api'})
-                MATCH (user:User {login: 'alice-dev'})
-                MATCH (cve:CVE {cve_id: 'CVE-2021-44228'})
-                MATCH (dep:Dependency {name: 'log4j-core', version: '2.14.1'})
-
-                CREATE (pr:PullRequest {
-                    number: 45,
-                    title: 'Implement user authentication service',
-                    state: 'merged',
-                    created_at: datetime('2021-10-20T11:00:00Z'),
-                    merged_at: datetime('2021-10-21T15:00:00Z')
-                })
-                CREATE (repo)-[:HAS_PR]->(pr)
-                CREATE (pr)-[:OPENED_BY]->(user)
-
-                CREATE (c:Commit {
-                    sha: 'd4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b20045',
-                    message: 'Add authentication with JWT and logging',
-                    author: 'alice-dev',
-                    timestamp: datetime('2021-10-20T11:30:00Z')
-                })
-                CREATE (pr)-[:CONTAINS_COMMIT]->(c)
-
-                CREATE (scan:Scan {
-                    id: 'scan-ua-45-bd',
-                    scanner: 'BLACKDUCK',
-                    started_at: datetime('2021-10-20T11:35:00Z'),
-                    completed_at: datetime('2021-10-20T11:42:00Z'),
-                    status: 'completed'
-                })
-                CREATE (c)-[:SCANNED_BY]->(scan)
-
-                CREATE (v:Vulnerability {
-                    id: 'vuln-ua-45-001',
-                    severity: 'CRITICAL',
-                    title: 'Log4Shell RCE in log4j-core',
-                    description: 'Remote code execution via JNDI lookup',
-                    cwe_id: 'CWE-502',
-                    cvss_score: 10.0,
-                    remediation: 'Upgrade to log4j-core 2.17.1 or later'
-                })
-                CREATE (scan)-[:DETECTED]->(v)
-                CREATE (v)-[:IN_DEPENDENCY]->(dep)
-                CREATE (v)-[:MAPS_TO]->(cve)
-            """)
-
+            {
+                "repo": "payment-service", "user": "charlie-ops", "number": 120, "state": "merged",
+                "title": "Add Terraform for payment service infrastructure",
+                "created_at": "2022-01-10T09:00:00Z", "merged_at": "2022-01-11T16:00:00Z",
+            },
+            # user-api also has Log4Shell (common vuln across repos)
+            {
+                "repo": "user-api", "user": "alice-dev", "number": 45, "state": "merged",
+                "title": "Implement user authentication service",
+                "created_at": "2021-10-20T11:00:00Z", "merged_at": "2021-10-21T15:00:00Z",
+            },
             # PR #52 - K8s deployment with issues
-            session.run("""
-                MATCH (repo:Repository {name: 'user-api'})
-                MATCH (user:User {login: 'charlie-ops'})
-                MATCH (f_deploy:File {path: 'k8s/deployment.yaml'})
-                MATCH (rule_root:Rule {name: 'Container Running as Root'})
-                MATCH (rule_limits:Rule {name: 'Missing Resource Limits'})
-
-                CREATE (pr:PullRequest {
-                    number: 52,
-                    title: 'Add Kubernetes manifests for user-api',
-                    state: 'open',
-                    created_at: datetime('2022-02-15T10:00:00Z')
-                })
-                CREATE (repo)-[:HAS_PR]->(pr)
-                CREATE (pr)-[:OPENED_BY]->(user)
-
-                CREATE (c:Commit {
-                    sha: 'e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2c30052',
-                    message: 'Add deployment and service manifests',
-                    author: 'charlie-ops',
-                    timestamp: datetime('2022-02-15T10:30:00Z')
-                })
-                CREATE (pr)-[:CONTAINS_COMMIT]->(c)
-
-                CREATE (scan:Scan {
-                    id: 'scan-ua-52-kics',
-                    scanner: 'KICS',
-                    started_at: datetime('2022-02-15T10:35:00Z'),
-                    completed_at: datetime('2022-02-15T10:38:00Z'),
-                    status: 'completed'
-                })
-                CREATE (c)-[:SCANNED_BY]->(scan)
-                CREATE (c)-[:MODIFIES]->(f_deploy)
-
-                CREATE (v1:Vulnerability {
-                    id: 'vuln-ua-52-001',
-                    severity: 'MEDIUM',
-                    title: 'Container Running as Root User',
-                    description: 'Pod security context does not specify non-root user',
-                    cwe_id: 'CWE-250',
-                    cvss_score: 5.5,
-                    remediation: 'Set securityContext.runAsNonRoot: true'
-                })
-                CREATE (v2:Vulnerability {
-                    id: 'vuln-ua-52-002',
-                    severity: 'LOW',
-                    title: 'Missing CPU and Memory Limits',
-                    description: 'Container does not specify resource limits',
-                    cwe_id: 'CWE-770',
-                    cvss_score: 3.5,
-                    remediation: 'Add resources.limits section'
-                })
-                CREATE (scan)-[:DETECTED]->(v1)
-                CREATE (scan)-[:DETECTED]->(v2)
-                CREATE (v1)-[:IN_FILE {line: 22, column: 8}]->(f_deploy)
-                CREATE (v2)-[:IN_FILE {line: 18, column: 8}]->(f_deploy)
-                CREATE (v1)-[:VIOLATES]->(rule_root)
-                CREATE (v2)-[:VIOLATES]->(rule_limits)
-                CREATE (scan)-[:USED_RULE]->(rule_root)
-                CREATE (scan)-[:USED_RULE]->(rule_limits)
-            """)
-
-            # ================================================================
-            # INVENTORY-MANAGER: Log4Shell + Spring4Shell (multiple CVEs)
-            # ================================================================
-
-            session.run("""
-                MATCH (repo:Repository {name: 'inventory-manager'})
-                MATCH (user:User {login: 'diana-lead'})
-                MATCH (cve1:CVE {cve_id: 'CVE-2021-44228'})
-                MATCH (cve2:CVE {cve_id: 'CVE-2022-22965'})
-                MATCH (dep_log4j:Dependency {name: 'log4j-core', version: '2.14.1'})
-                MATCH (dep_spring:Dependency {name: 'spring-core', version: '5.3.18'})
-
-                CREATE (pr:PullRequest {
-                    number: 78,
-                    title: 'Migrate to Spring Boot for inventory management',
-                    state: 'merged',
-                    created_at: datetime('2022-02-01T09:00:00Z'),
-                    merged_at: datetime('2022-02-03T17:00:00Z')
-                })
-                CREATE (repo)-[:HAS_PR]->(pr)
-                CREATE (pr)-[:OPENED_BY]->(user)
-
-                CREATE (c:Commit {
-                    sha: 'f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d40078',
-                    message: 'Add Spring Boot starter with logging',
-                    author: 'diana-lead',
-                    timestamp: datetime('2022-02-01T09:30:00Z')
-                })
-                CREATE (pr)-[:CONTAINS_COMMIT]->(c)
-
-                CREATE (scan:Scan {
-                    id: 'scan-im-78-bd',
-                    scanner: 'BLACKDUCK',
-                    started_at: datetime('2022-02-01T09:35:00Z'),
-                    completed_at: datetime('2022-02-01T09:50:00Z'),
-                    status: 'completed'
-                })
-                CREATE (c)-[:SCANNED_BY]->(scan)
-
-                CREATE (v1:Vulnerability {
-                    id: 'vuln-im-78-001',
-                    severity: 'CRITICAL',
-                    title: 'Log4Shell RCE in log4j-core',
-                    description: 'Remote code execution via JNDI lookup',
-                    cwe_id: 'CWE-502',
-                    cvss_score: 10.0,
-                    remediation: 'Upgrade to log4j-core 2.17.1 or later'
-                })
-                CREATE (v2:Vulnerability {
-                    id: 'vuln-im-78-002',
-                    severity: 'CRITICAL',
-                    title: 'Spring4Shell RCE in spring-core',
-                    description: 'Remote code execution via data binding',
-                    cwe_id: 'CWE-94',
-                    cvss_score: 9.8,
-                    remediation: 'Upgrade to spring-core 5.3.20 or later'
-                })
-                CREATE (scan)-[:DETECTED]->(v1)
-                CREATE (scan)-[:DETECTED]->(v2)
-                CREATE (v1)-[:IN_DEPENDENCY]->(dep_log4j)
-                CREATE (v2)-[:IN_DEPENDENCY]->(dep_spring)
-                CREATE (v1)-[:MAPS_TO]->(cve1)
-                CREATE (v2)-[:MAPS_TO]->(cve2)
-            """)
-
-            # ================================================================
-            # NOTIFICATION-WORKER: Transitive dependency vulnerability
-            # ================================================================
-
-            session.run("""
-                MATCH (repo:Repository {name: 'notification-worker'})
-                MATCH (user:User {login: 'eve-junior'})
-                MATCH (cve:CVE {cve_id: 'CVE-2021-44228'})
-                MATCH (dep_starter:Dependency {name: 'spring-boot-starter', version: '2.6.1'})
-
-                CREATE (pr:PullRequest {
-                    number: 23,
-                    title: 'Initialize notification worker service',
-                    state: 'merged',
-                    created_at: datetime('2022-03-10T14:00:00Z'),
-                    merged_at: datetime('2022-03-11T10:00:00Z')
-                })
-                CREATE (repo)-[:HAS_PR]->(pr)
-                CREATE (pr)-[:OPENED_BY]->(user)
-
-                CREATE (c:Commit {
-                    sha: 'a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e50023',
-                    message: 'Add spring-boot-starter for message processing',
-                    author: 'eve-junior',
-                    timestamp: datetime('2022-03-10T14:30:00Z')
-                })
-                CREATE (pr)-[:CONTAINS_COMMIT]->(c)
-
-                CREATE (scan:Scan {
-                    id: 'scan-nw-23-bd',
-                    scanner: 'BLACKDUCK',
-                    started_at: datetime('2022-03-10T14:35:00Z'),
-                    completed_at: datetime('2022-03-10T14:55:00Z'),
-                    status: 'completed'
-                })
-                CREATE (c)-[:SCANNED_BY]->(scan)
-
-                CREATE (v:Vulnerability {
-                    id: 'vuln-nw-23-001',
-                    severity: 'CRITICAL',
-                    title: 'Log4Shell via transitive dependency spring-boot-starter -> log4j-core',
-                    description: 'Transitive dependency contains critical RCE vulnerability',
-                    cwe_id: 'CWE-502',
-                    cvss_score: 10.0,
-                    remediation: 'Override log4j-core version to 2.17.1 in dependency management'
-                })
-                CREATE (scan)-[:DETECTED]->(v)
-                CREATE (v)-[:IN_DEPENDENCY]->(dep_starter)
-                CREATE (v)-[:MAPS_TO]->(cve)
-            """)
-
-            # ================================================================
-            # ANALYTICS-DASHBOARD: Text4Shell vulnerability
-            # ================================================================
-
-            session.run("""
-                MATCH (repo:Repository {name: 'analytics-dashboard'})
-                MATCH (user:User {login: 'alice-dev'})
-                MATCH (cve:CVE {cve_id: 'CVE-2022-42889'})
-                MATCH (dep:Dependency {name: 'commons-text', version: '1.9'})
-
-                CREATE (pr:PullRequest {
-                    number: 89,
-                    title: 'Add report generation with text templating',
-                    state: 'merged',
-                    created_at: datetime('2022-09-20T11:00:00Z'),
-                    merged_at: datetime('2022-09-21T09:00:00Z')
-                })
-                CREATE (repo)-[:HAS_PR]->(pr)
-                CREATE (pr)-[:OPENED_BY]->(user)
-
-                CREATE (c:Commit {
-                    sha: 'b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f60089',
-                    message: 'Add commons-text for report string interpolation',
-                    author: 'alice-dev',
-                    timestamp: datetime('2022-09-20T11:30:00Z')
-                })
-                CREATE (pr)-[:CONTAINS_COMMIT]->(c)
-
-                CREATE (scan:Scan {
-                    id: 'scan-ad-89-bd',
-                    scanner: 'BLACKDUCK',
-                    started_at: datetime('2022-09-20T11:35:00Z'),
-                    completed_at: datetime('2022-09-20T11:45:00Z'),
-                    status: 'completed'
-                })
-                CREATE (c)-[:SCANNED_BY]->(scan)
-
-                CREATE (v:Vulnerability {
-                    id: 'vuln-ad-89-001',
-                    severity: 'CRITICAL',
-                    title: 'Text4Shell RCE in commons-text',
-                    description: 'Remote code execution via string interpolation',
-                    cwe_id: 'CWE-94',
-                    cvss_score: 9.8,
-                    remediation: 'Upgrade to commons-text 1.10.0 or later'
-                })
-                CREATE (scan)-[:DETECTED]->(v)
-                CREATE (v)-[:IN_DEPENDENCY]->(dep)
-                CREATE (v)-[:MAPS_TO]->(cve)
-            """)
-
-            # ================================================================
-            # SHARED-INFRA: Multiple KICS findings
-            # ================================================================
-
-            session.run("""
-                MATCH (repo:Repository {name: 'shared-infra'})
-                MATCH (user:User {login: 'charlie-ops'})
-                MATCH (f_iam:File {path: 'infra/terraform/iam.tf'})
-                MATCH (f_rds:File {path: 'infra/terraform/rds.tf'})
-                MATCH (f_ci:File {path: '.github/workflows/ci.yaml'})
-                MATCH (rule_iam:Rule {name: 'IAM Policy Allows All Resources'})
-                MATCH (rule_rds:Rule {name: 'RDS Publicly Accessible'})
-                MATCH (rule_secrets:Rule {name: 'Secrets in Environment Variables'})
-
-                CREATE (pr:PullRequest {
-                    number: 201,
-                    title: 'Add shared Terraform modules for AWS',
-                    state: 'open',
-                    created_at: datetime('2022-04-01T08:00:00Z')
-                })
-                CREATE (repo)-[:HAS_PR]->(pr)
-                CREATE (pr)-[:OPENED_BY]->(user)
-
-                CREATE (c1:Commit {
-                    sha: 'c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a10201a',
-                    message: 'Add IAM module',
-                    author: 'charlie-ops',
-                    timestamp: datetime('2022-04-01T08:30:00Z')
-                })
-                CREATE (c2:Commit {
-                    sha: 'c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a10201b',
-                    message: 'Add RDS module',
-                    author: 'charlie-ops',
-                    timestamp: datetime('2022-04-01T10:00:00Z')
-                })
-                CREATE (c3:Commit {
-                    sha: 'c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a10201c',
-                    message: 'Add CI workflow with secrets',
-                    author: 'charlie-ops',
-                    timestamp: datetime('2022-04-01T14:00:00Z')
-                })
-                CREATE (pr)-[:CONTAINS_COMMIT]->(c1)
-                CREATE (pr)-[:CONTAINS_COMMIT]->(c2)
-                CREATE (pr)-[:CONTAINS_COMMIT]->(c3)
-
-                CREATE (scan1:Scan {
-                    id: 'scan-si-201a-kics',
-                    scanner: 'KICS',
-                    started_at: datetime('2022-04-01T08:35:00Z'),
-                    completed_at: datetime('2022-04-01T08:38:00Z'),
-                    status: 'completed'
-                })
-                CREATE (c1)-[:SCANNED_BY]->(scan1)
-                CREATE (c1)-[:MODIFIES]->(f_iam)
-
-                CREATE (v1:Vulnerability {
-                    id: 'vuln-si-201-001',
-                    severity: 'HIGH',
-                    title: 'IAM Policy with Wildcard Resources',
-                    description: 'IAM policy uses Resource: * allowing access to all resources',
-                    cwe_id: 'CWE-732',
-                    cvss_score: 7.5,
-                    remediation: 'Restrict Resource to specific ARNs'
-                })
-                CREATE (scan1)-[:DETECTED]->(v1)
-                CREATE (v1)-[:IN_FILE {line: 12, column: 3}]->(f_iam)
-                CREATE (v1)-[:VIOLATES]->(rule_iam)
-                CREATE (scan1)-[:USED_RULE]->(rule_iam)
-
-                CREATE (scan2:Scan {
-                    id: 'scan-si-201b-kics',
-                    scanner: 'KICS',
-                    started_at: datetime('2022-04-01T10:05:00Z'),
-                    completed_at: datetime('2022-04-01T10:08:00Z'),
-                    status: 'completed'
-                })
-                CREATE (c2)-[:SCANNED_BY]->(scan2)
-                CREATE (c2)-[:MODIFIES]->(f_rds)
-
-                CREATE (v2:Vulnerability {
-                    id: 'vuln-si-201-002',
-                    severity: 'HIGH',
-                    title: 'RDS Instance Publicly Accessible',
-                    description: 'RDS instance has publicly_accessible set to true',
-                    cwe_id: 'CWE-284',
-                    cvss_score: 8.0,
-                    remediation: 'Set publicly_accessible = false'
-                })
-                CREATE (scan2)-[:DETECTED]->(v2)
-                CREATE (v2)-[:IN_FILE {line: 8, column: 3}]->(f_rds)
-                CREATE (v2)-[:VIOLATES]->(rule_rds)
-                CREATE (scan2)-[:USED_RULE]->(rule_rds)
-
-                CREATE (scan3:Scan {
-                    id: 'scan-si-201c-kics',
-                    scanner: 'KICS',
-                    started_at: datetime('2022-04-01T14:05:00Z'),
-                    completed_at: datetime('2022-04-01T14:08:00Z'),
-                    status: 'completed'
-                })
-                CREATE (c3)-[:SCANNED_BY]->(scan3)
-                CREATE (c3)-[:MODIFIES]->(f_ci)
-
-                CREATE (v3:Vulnerability {
-                    id: 'vuln-si-201-003',
-                    severity: 'CRITICAL',
-                    title: 'Hardcoded AWS Credentials in CI Workflow',
-                    description: 'AWS_SECRET_ACCESS_KEY exposed in environment variables',
-                    cwe_id: 'CWE-798',
-                    cvss_score: 9.5,
-                    remediation: 'Use GitHub secrets or OIDC for AWS authentication'
-                })
-                CREATE (scan3)-[:DETECTED]->(v3)
-                CREATE (v3)-[:IN_FILE {line: 25, column: 10}]->(f_ci)
-                CREATE (v3)-[:VIOLATES]->(rule_secrets)
-                CREATE (scan3)-[:USED_RULE]->(rule_secrets)
-            """)
-
+            {
+                "repo": "user-api", "user": "charlie-ops", "number": 52, "state": "open",
+                "title": "Add Kubernetes manifests for user-api",
+                "created_at": "2022-02-15T10:00:00Z", "merged_at": None,
+            },
+            # inventory-manager: Log4Shell + Spring4Shell (multiple CVEs)
+            {
+                "repo": "inventory-manager", "user": "diana-lead", "number": 78, "state": "merged",
+                "title": "Migrate to Spring Boot for inventory management",
+                "created_at": "2022-02-01T09:00:00Z", "merged_at": "2022-02-03T17:00:00Z",
+            },
+            # notification-worker: transitive dependency vulnerability
+            {
+                "repo": "notification-worker", "user": "eve-junior", "number": 23, "state": "merged",
+                "title": "Initialize notification worker service",
+                "created_at": "2022-03-10T14:00:00Z", "merged_at": "2022-03-11T10:00:00Z",
+            },
+            # analytics-dashboard: Text4Shell vulnerability
+            {
+                "repo": "analytics-dashboard", "user": "alice-dev", "number": 89, "state": "merged",
+                "title": "Add report generation with text templating",
+                "created_at": "2022-09-20T11:00:00Z", "merged_at": "2022-09-21T09:00:00Z",
+            },
+            # shared-infra: multiple KICS findings
+            {
+                "repo": "shared-infra", "user": "charlie-ops", "number": 201, "state": "open",
+                "title": "Add shared Terraform modules for AWS",
+                "created_at": "2022-04-01T08:00:00Z", "merged_at": None,
+            },
             # Additional PRs for more data
-            session.run("""
-                MATCH (repo:Repository {name: 'payment-service'})
-                MATCH (user:User {login: 'diana-lead'})
-                MATCH (f_cf:File {path: 'infra/cloudformation/main.yaml'})
-                MATCH (rule_ct:Rule {name: 'CloudTrail Disabled'})
-
-                CREATE (pr:PullRequest {
-                    number: 125,
-                    title: 'Add CloudWatch logging configuration',
-                    state: 'merged',
-                    created_at: datetime('2022-05-15T09:00:00Z'),
-                    merged_at: datetime('2022-05-16T11:00:00Z')
-                })
-                CREATE (repo)-[:HAS_PR]->(pr)
-                CREATE (pr)-[:OPENED_BY]->(user)
-
-                CREATE (c:Commit {
-                    sha: 'd4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b20125',
-                    message: 'Add CloudTrail configuration',
-                    author: 'diana-lead',
-                    timestamp: datetime('2022-05-15T09:30:00Z')
-                })
-                CREATE (pr)-[:CONTAINS_COMMIT]->(c)
-
-                CREATE (scan:Scan {
-                    id: 'scan-ps-125-kics',
-                    scanner: 'KICS',
-                    started_at: datetime('2022-05-15T09:35:00Z'),
-                    completed_at: datetime('2022-05-15T09:38:00Z'),
-                    status: 'completed'
-                })
-                CREATE (c)-[:SCANNED_BY]->(scan)
-                CREATE (c)-[:MODIFIES]->(f_cf)
-
-                CREATE (v:Vulnerability {
-                    id: 'vuln-ps-125-001',
-                    severity: 'MEDIUM',
-                    title: 'CloudTrail Log File Validation Disabled',
-                    description: 'CloudTrail does not have log file validation enabled',
-                    cwe_id: 'CWE-354',
-                    cvss_score: 5.0,
-                    remediation: 'Enable EnableLogFileValidation'
-                })
-                CREATE (scan)-[:DETECTED]->(v)
-                CREATE (v)-[:IN_FILE {line: 45, column: 6}]->(f_cf)
-                CREATE (v)-[:VIOLATES]->(rule_ct)
-                CREATE (scan)-[:USED_RULE]->(rule_ct)
-            """)
-
+            {
+                "repo": "payment-service", "user": "diana-lead", "number": 125, "state": "merged",
+                "title": "Add CloudWatch logging configuration",
+                "created_at": "2022-05-15T09:00:00Z", "merged_at": "2022-05-16T11:00:00Z",
+            },
             # inventory-manager partial fix
-            session.run("""
-                MATCH (repo:Repository {name: 'inventory-manager'})
-                MATCH (user:User {login: 'bob-sec'})
-                MATCH (cve:CVE {cve_id: 'CVE-2021-44228'})
-                MATCH (dep:Dependency {name: 'log4j-core', version: '2.14.1'})
-
-                CREATE (pr:PullRequest {
-                    number: 85,
-                    title: 'Upgrade Spring to fix Spring4Shell',
-                    state: 'merged',
-                    created_at: datetime('2022-04-05T08:00:00Z'),
-                    merged_at: datetime('2022-04-05T12:00:00Z')
-                })
-                CREATE (repo)-[:HAS_PR]->(pr)
-                CREATE (pr)-[:OPENED_BY]->(user)
-
-                CREATE (c:Commit {
-                    sha: 'f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d40085',
-                    message: 'Upgrade spring-core to 5.3.20',
-                    author: 'bob-sec',
-                    timestamp: datetime('2022-04-05T08:30:00Z')
-                })
-                CREATE (pr)-[:CONTAINS_COMMIT]->(c)
-
-                CREATE (scan:Scan {
-                    id: 'scan-im-85-bd',
-                    scanner: 'BLACKDUCK',
-                    started_at: datetime('2022-04-05T08:35:00Z'),
-                    completed_at: datetime('2022-04-05T08:50:00Z'),
-                    status: 'completed'
-                })
-                CREATE (c)-[:SCANNED_BY]->(scan)
-
-                CREATE (v:Vulnerability {
-                    id: 'vuln-im-85-001',
-                    severity: 'CRITICAL',
-                    title: 'Log4Shell RCE in log4j-core (still present)',
-                    description: 'Log4j vulnerability not yet remediated',
-                    cwe_id: 'CWE-502',
-                    cvss_score: 10.0,
-                    remediation: 'Upgrade to log4j-core 2.17.1 or later'
-                })
-                CREATE (scan)-[:DETECTED]->(v)
-                CREATE (v)-[:IN_DEPENDENCY]->(dep)
-                CREATE (v)-[:MAPS_TO]->(cve)
-            """)
+            {
+                "repo": "inventory-manager", "user": "bob-sec", "number": 85, "state": "merged",
+                "title": "Upgrade Spring to fix Spring4Shell",
+                "created_at": "2022-04-05T08:00:00Z", "merged_at": "2022-04-05T12:00:00Z",
+            },
+        ]
+        commits = [
+            {
+                "repo": "payment-service", "pr_number": 101, "author": "eve-junior",
+                "sha": "a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f60101",
+                "message": "Add log4j dependency for structured logging",
+                "timestamp": "2021-11-15T10:30:00Z",
+            },
+            {
+                "repo": "payment-service", "pr_number": 115, "author": "bob-sec",
+                "sha": "b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f60115",
+                "message": "Upgrade log4j-core to 2.17.1",
+                "timestamp": "2021-12-13T08:30:00Z",
+            },
+            {
+                "repo": "payment-service", "pr_number": 120, "author": "charlie-ops",
+                "sha": "c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f60120a",
+                "message": "Add S3 bucket for payment receipts",
+                "timestamp": "2022-01-10T09:30:00Z", "modifies": "infra/terraform/s3.tf",
+            },
+            {
+                "repo": "payment-service", "pr_number": 120, "author": "charlie-ops",
+                "sha": "c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f60120b",
+                "message": "Add security groups for payment API",
+                "timestamp": "2022-01-10T14:00:00Z", "modifies": "infra/terraform/security-groups.tf",
+            },
+            {
+                "repo": "user-api", "pr_number": 45, "author": "alice-dev",
+                "sha": "d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b20045",
+                "message": "Add authentication with JWT and logging",
+                "timestamp": "2021-10-20T11:30:00Z",
+            },
+            {
+                "repo": "user-api", "pr_number": 52, "author": "charlie-ops",
+                "sha": "e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2c30052",
+                "message": "Add deployment and service manifests",
+                "timestamp": "2022-02-15T10:30:00Z", "modifies": "k8s/deployment.yaml",
+            },
+            {
+                "repo": "inventory-manager", "pr_number": 78, "author": "diana-lead",
+                "sha": "f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d40078",
+                "message": "Add Spring Boot starter with logging",
+                "timestamp": "2022-02-01T09:30:00Z",
+            },
+            {
+                "repo": "notification-worker", "pr_number": 23, "author": "eve-junior",
+                "sha": "a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e50023",
+                "message": "Add spring-boot-starter for message processing",
+                "timestamp": "2022-03-10T14:30:00Z",
+            },
+            {
+                "repo": "analytics-dashboard", "pr_number": 89, "author": "alice-dev",
+                "sha": "b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f60089",
+                "message": "Add commons-text for report string interpolation",
+                "timestamp": "2022-09-20T11:30:00Z",
+            },
+            {
+                "repo": "shared-infra", "pr_number": 201, "author": "charlie-ops",
+                "sha": "c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a10201a",
+                "message": "Add IAM module",
+                "timestamp": "2022-04-01T08:30:00Z", "modifies": "infra/terraform/iam.tf",
+            },
+            {
+                "repo": "shared-infra", "pr_number": 201, "author": "charlie-ops",
+                "sha": "c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a10201b",
+                "message": "Add RDS module",
+                "timestamp": "2022-04-01T10:00:00Z", "modifies": "infra/terraform/rds.tf",
+            },
+            {
+                "repo": "shared-infra", "pr_number": 201, "author": "charlie-ops",
+                "sha": "c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a10201c",
+                "message": "Add CI workflow with secrets",
+                "timestamp": "2022-04-01T14:00:00Z", "modifies": ".github/workflows/ci.yaml",
+            },
+            {
+                "repo": "payment-service", "pr_number": 125, "author": "diana-lead",
+                "sha": "d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b20125",
+                "message": "Add CloudTrail configuration",
+                "timestamp": "2022-05-15T09:30:00Z", "modifies": "infra/cloudformation/main.yaml",
+            },
+            {
+                "repo": "inventory-manager", "pr_number": 85, "author": "bob-sec",
+                "sha": "f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d40085",
+                "message": "Upgrade spring-core to 5.3.20",
+                "timestamp": "2022-04-05T08:30:00Z",
+            },
+        ]
+        scans = [
+            {
+                "id": "scan-ps-101-bd", "scanner": "BLACKDUCK", "sha": "a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f60101",
+                "started_at": "2021-11-15T10:35:00Z", "completed_at": "2021-11-15T10:40:00Z",
+            },
+            {
+                "id": "scan-ps-115-bd", "scanner": "BLACKDUCK", "sha": "b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f60115",
+                "started_at": "2021-12-13T08:35:00Z", "completed_at": "2021-12-13T08:40:00Z",
+            },
+            {
+                "id": "scan-ps-120a-kics", "scanner": "KICS", "sha": "c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f60120a",
+                "started_at": "2022-01-10T09:35:00Z", "completed_at": "2022-01-10T09:38:00Z",
+            },
+            {
+                "id": "scan-ps-120b-kics", "scanner": "KICS", "sha": "c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f60120b",
+                "started_at": "2022-01-10T14:05:00Z", "completed_at": "2022-01-10T14:08:00Z",
+            },
+            {
+                "id": "scan-ua-45-bd", "scanner": "BLACKDUCK", "sha": "d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b20045",
+                "started_at": "2021-10-20T11:35:00Z", "completed_at": "2021-10-20T11:42:00Z",
+            },
+            {
+                "id": "scan-ua-52-kics", "scanner": "KICS", "sha": "e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2c30052",
+                "started_at": "2022-02-15T10:35:00Z", "completed_at": "2022-02-15T10:38:00Z",
+            },
+            {
+                "id": "scan-im-78-bd", "scanner": "BLACKDUCK", "sha": "f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d40078",
+                "started_at": "2022-02-01T09:35:00Z", "completed_at": "2022-02-01T09:50:00Z",
+            },
+            {
+                "id": "scan-nw-23-bd", "scanner": "BLACKDUCK", "sha": "a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e50023",
+                "started_at": "2022-03-10T14:35:00Z", "completed_at": "2022-03-10T14:55:00Z",
+            },
+            {
+                "id": "scan-ad-89-bd", "scanner": "BLACKDUCK", "sha": "b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f60089",
+                "started_at": "2022-09-20T11:35:00Z", "completed_at": "2022-09-20T11:45:00Z",
+            },
+            {
+                "id": "scan-si-201a-kics", "scanner": "KICS", "sha": "c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a10201a",
+                "started_at": "2022-04-01T08:35:00Z", "completed_at": "2022-04-01T08:38:00Z",
+            },
+            {
+                "id": "scan-si-201b-kics", "scanner": "KICS", "sha": "c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a10201b",
+                "started_at": "2022-04-01T10:05:00Z", "completed_at": "2022-04-01T10:08:00Z",
+            },
+            {
+                "id": "scan-si-201c-kics", "scanner": "KICS", "sha": "c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a10201c",
+                "started_at": "2022-04-01T14:05:00Z", "completed_at": "2022-04-01T14:08:00Z",
+            },
+            {
+                "id": "scan-ps-125-kics", "scanner": "KICS", "sha": "d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b20125",
+                "started_at": "2022-05-15T09:35:00Z", "completed_at": "2022-05-15T09:38:00Z",
+            },
+            {
+                "id": "scan-im-85-bd", "scanner": "BLACKDUCK", "sha": "f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d40085",
+                "started_at": "2022-04-05T08:35:00Z", "completed_at": "2022-04-05T08:50:00Z",
+            },
+        ]
+        vulns = [
+            {
+                "scan_id": "scan-ps-101-bd", "id": "vuln-ps-101-001", "severity": "CRITICAL", "cwe_id": "CWE-502", "cvss_score": 10.0,
+                "title": "Log4Shell RCE in log4j-core",
+                "description": "Remote code execution via JNDI lookup",
+                "remediation": "Upgrade to log4j-core 2.17.1 or later",
+                "dep_name": "log4j-core", "dep_version": "2.14.1", "cve_id": "CVE-2021-44228",
+            },
+            {
+                "scan_id": "scan-ps-120a-kics", "id": "vuln-ps-120-001", "severity": "HIGH", "cwe_id": "CWE-311", "cvss_score": 7.5,
+                "title": "S3 Bucket Without Server-Side Encryption",
+                "description": "Payment receipts bucket does not have encryption enabled",
+                "remediation": "Enable SSE-S3 or SSE-KMS encryption",
+                "file_path": "infra/terraform/s3.tf", "line": 15, "column": 1,
+                "rule": "S3 Bucket SSE Disabled",
+            },
+            {
+                "scan_id": "scan-ps-120b-kics", "id": "vuln-ps-120-002", "severity": "CRITICAL", "cwe_id": "CWE-284", "cvss_score": 9.1,
+                "title": "Security Group Allows Unrestricted Ingress on Port 22",
+                "description": "SSH port open to 0.0.0.0/0",
+                "remediation": "Restrict ingress to specific IP ranges",
+                "file_path": "infra/terraform/security-groups.tf", "line": 28, "column": 5,
+                "rule": "Security Group Unrestricted Ingress",
+            },
+            {
+                "scan_id": "scan-ua-45-bd", "id": "vuln-ua-45-001", "severity": "CRITICAL", "cwe_id": "CWE-502", "cvss_score": 10.0,
+                "title": "Log4Shell RCE in log4j-core",
+                "description": "Remote code execution via JNDI lookup",
+                "remediation": "Upgrade to log4j-core 2.17.1 or later",
+                "dep_name": "log4j-core", "dep_version": "2.14.1", "cve_id": "CVE-2021-44228",
+            },
+            {
+                "scan_id": "scan-ua-52-kics", "id": "vuln-ua-52-001", "severity": "MEDIUM", "cwe_id": "CWE-250", "cvss_score": 5.5,
+                "title": "Container Running as Root User",
+                "description": "Pod security context does not specify non-root user",
+                "remediation": "Set securityContext.runAsNonRoot: true",
+                "file_path": "k8s/deployment.yaml", "line": 22, "column": 8,
+                "rule": "Container Running as Root",
+            },
+            {
+                "scan_id": "scan-ua-52-kics", "id": "vuln-ua-52-002", "severity": "LOW", "cwe_id": "CWE-770", "cvss_score": 3.5,
+                "title": "Missing CPU and Memory Limits",
+                "description": "Container does not specify resource limits",
+                "remediation": "Add resources.limits section",
+                "file_path": "k8s/deployment.yaml", "line": 18, "column": 8,
+                "rule": "Missing Resource Limits",
+            },
+            {
+                "scan_id": "scan-im-78-bd", "id": "vuln-im-78-001", "severity": "CRITICAL", "cwe_id": "CWE-502", "cvss_score": 10.0,
+                "title": "Log4Shell RCE in log4j-core",
+                "description": "Remote code execution via JNDI lookup",
+                "remediation": "Upgrade to log4j-core 2.17.1 or later",
+                "dep_name": "log4j-core", "dep_version": "2.14.1", "cve_id": "CVE-2021-44228",
+            },
+            {
+                "scan_id": "scan-im-78-bd", "id": "vuln-im-78-002", "severity": "CRITICAL", "cwe_id": "CWE-94", "cvss_score": 9.8,
+                "title": "Spring4Shell RCE in spring-core",
+                "description": "Remote code execution via data binding",
+                "remediation": "Upgrade to spring-core 5.3.20 or later",
+                "dep_name": "spring-core", "dep_version": "5.3.18", "cve_id": "CVE-2022-22965",
+            },
+            {
+                "scan_id": "scan-nw-23-bd", "id": "vuln-nw-23-001", "severity": "CRITICAL", "cwe_id": "CWE-502", "cvss_score": 10.0,
+                "title": "Log4Shell via transitive dependency spring-boot-starter -> log4j-core",
+                "description": "Transitive dependency contains critical RCE vulnerability",
+                "remediation": "Override log4j-core version to 2.17.1 in dependency management",
+                "dep_name": "spring-boot-starter", "dep_version": "2.6.1", "cve_id": "CVE-2021-44228",
+            },
+            {
+                "scan_id": "scan-ad-89-bd", "id": "vuln-ad-89-001", "severity": "CRITICAL", "cwe_id": "CWE-94", "cvss_score": 9.8,
+                "title": "Text4Shell RCE in commons-text",
+                "description": "Remote code execution via string interpolation",
+                "remediation": "Upgrade to commons-text 1.10.0 or later",
+                "dep_name": "commons-text", "dep_version": "1.9", "cve_id": "CVE-2022-42889",
+            },
+            {
+                "scan_id": "scan-si-201a-kics", "id": "vuln-si-201-001", "severity": "HIGH", "cwe_id": "CWE-732", "cvss_score": 7.5,
+                "title": "IAM Policy with Wildcard Resources",
+                "description": "IAM policy uses Resource: * allowing access to all resources",
+                "remediation": "Restrict Resource to specific ARNs",
+                "file_path": "infra/terraform/iam.tf", "line": 12, "column": 3,
+                "rule": "IAM Policy Allows All Resources",
+            },
+            {
+                "scan_id": "scan-si-201b-kics", "id": "vuln-si-201-002", "severity": "HIGH", "cwe_id": "CWE-284", "cvss_score": 8.0,
+                "title": "RDS Instance Publicly Accessible",
+                "description": "RDS instance has publicly_accessible set to true",
+                "remediation": "Set publicly_accessible = false",
+                "file_path": "infra/terraform/rds.tf", "line": 8, "column": 3,
+                "rule": "RDS Publicly Accessible",
+            },
+            {
+                "scan_id": "scan-si-201c-kics", "id": "vuln-si-201-003", "severity": "CRITICAL", "cwe_id": "CWE-798", "cvss_score": 9.5,
+                "title": "Hardcoded AWS Credentials in CI Workflow",
+                "description": "AWS_SECRET_ACCESS_KEY exposed in environment variables",
+                "remediation": "Use GitHub secrets or OIDC for AWS authentication",
+                "file_path": ".github/workflows/ci.yaml", "line": 25, "column": 10,
+                "rule": "Secrets in Environment Variables",
+            },
+            {
+                "scan_id": "scan-ps-125-kics", "id": "vuln-ps-125-001", "severity": "MEDIUM", "cwe_id": "CWE-354", "cvss_score": 5.0,
+                "title": "CloudTrail Log File Validation Disabled",
+                "description": "CloudTrail does not have log file validation enabled",
+                "remediation": "Enable EnableLogFileValidation",
+                "file_path": "infra/cloudformation/main.yaml", "line": 45, "column": 6,
+                "rule": "CloudTrail Disabled",
+            },
+            {
+                "scan_id": "scan-im-85-bd", "id": "vuln-im-85-001", "severity": "CRITICAL", "cwe_id": "CWE-502", "cvss_score": 10.0,
+                "title": "Log4Shell RCE in log4j-core (still present)",
+                "description": "Log4j vulnerability not yet remediated",
+                "remediation": "Upgrade to log4j-core 2.17.1 or later",
+                "dep_name": "log4j-core", "dep_version": "2.14.1", "cve_id": "CVE-2021-44228",
+            },
+        ]
+
+        # All PR, commit, scan and vulnerability writes go out in a single transaction.
+        # Reference nodes are addressed by the element ids cached when they were
+        # seeded, and each step returns the ids of what it wrote for the next one.
+        # execute_write retries the whole function on transient errors; every
+        # step MERGEs, so a replay is safe.
+        def write(tx):
+            pr_ids = self._unwind_ids(tx, """
+                UNWIND $rows AS row
+                MATCH (repo:Repository) WHERE elementId(repo) = row.repo_ref
+                MATCH (user:User) WHERE elementId(user) = row.user_ref
+                MERGE (repo)-[:HAS_PR]->(pr:PullRequest {number: row.number})
+                SET pr.title = row.title,
+                    pr.state = row.state,
+                    pr.created_at = datetime(row.created_at),
+                    pr.merged_at = datetime(row.merged_at)
+                MERGE (pr)-[:OPENED_BY]->(user)
+                RETURN [row.repo, pr.number] AS key, elementId(pr) AS id
+            """, [
+                {**pr, "repo_ref": self._repo_ids[pr["repo"]], "user_ref": self._user_ids[pr["user"]]}
+                for pr in prs
+            ])
+
+            commit_ids = self._unwind_ids(tx, """
+                UNWIND $rows AS row
+                MATCH (pr:PullRequest) WHERE elementId(pr) = row.pr_ref
+                MERGE (c:Commit {sha: row.sha})
+                SET c.message = row.message,
+                    c.author = row.author,
+                    c.timestamp = datetime(row.timestamp)
+                MERGE (pr)-[:CONTAINS_COMMIT]->(c)
+                RETURN c.sha AS key, elementId(c) AS id
+            """, [{**c, "pr_ref": pr_ids[(c["repo"], c["pr_number"])]} for c in commits])
+
+            tx.run("""
+                UNWIND $rows AS row
+                MATCH (c:Commit) WHERE elementId(c) = row.a
+                MATCH (f:File) WHERE elementId(f) = row.b
+                MERGE (c)-[:MODIFIES]->(f)
+            """, rows=[
+                {"a": commit_ids[c["sha"]], "b": self._file_ids[c["modifies"]]}
+                for c in commits if "modifies" in c
+            ])
+
+            scan_ids = self._unwind_ids(tx, """
+                UNWIND $rows AS row
+                MATCH (c:Commit) WHERE elementId(c) = row.commit_ref
+                MERGE (scan:Scan {id: row.id})
+                SET scan.scanner = row.scanner,
+                    scan.started_at = datetime(row.started_at),
+                    scan.completed_at = datetime(row.completed_at),
+                    scan.status = 'completed'
+                MERGE (c)-[:SCANNED_BY]->(scan)
+                RETURN scan.id AS key, elementId(scan) AS id
+            """, [{**scan, "commit_ref": commit_ids[scan["sha"]]} for scan in scans])
+
+            vuln_ids = self._unwind_ids(tx, """
+                UNWIND $rows AS row
+                MATCH (scan:Scan) WHERE elementId(scan) = row.scan_ref
+                MERGE (v:Vulnerability {id: row.id})
+                SET v.severity = row.severity,
+                    v.title = row.title,
+                    v.description = row.description,
+                    v.cwe_id = row.cwe_id,
+                    v.cvss_score = row.cvss_score,
+                    v.remediation = row.remediation
+                MERGE (scan)-[:DETECTED]->(v)
+                RETURN v.id AS key, elementId(v) AS id
+            """, [{**v, "scan_ref": scan_ids[v["scan_id"]]} for v in vulns])
+
+            tx.run("""
+                UNWIND $rows AS row
+                MATCH (v:Vulnerability) WHERE elementId(v) = row.a
+                MATCH (dep:Dependency) WHERE elementId(dep) = row.b
+                MERGE (v)-[:IN_DEPENDENCY]->(dep)
+            """, rows=[
+                {"a": vuln_ids[v["id"]], "b": self._dep_ids[(v["dep_name"], v["dep_version"])]}
+                for v in vulns if "dep_name" in v
+            ])
+
+            tx.run("""
+                UNWIND $rows AS row
+                MATCH (v:Vulnerability) WHERE elementId(v) = row.a
+                MATCH (cve:CVE) WHERE elementId(cve) = row.b
+                MERGE (v)-[:MAPS_TO]->(cve)
+            """, rows=[
+                {"a": vuln_ids[v["id"]], "b": self._cve_ids[v["cve_id"]]}
+                for v in vulns if "cve_id" in v
+            ])
+
+            tx.run("""
+                UNWIND $rows AS row
+                MATCH (v:Vulnerability) WHERE elementId(v) = row.a
+                MATCH (f:File) WHERE elementId(f) = row.b
+                MERGE (v)-[in_file:IN_FILE]->(f)
+                SET in_file.line = row.line, in_file.column = row.column
+            """, rows=[
+                {"a": vuln_ids[v["id"]], "b": self._file_ids[v["file_path"]],
+                 "line": v["line"], "column": v["column"]}
+                for v in vulns if "file_path" in v
+            ])
+
+            kics_vulns = [v for v in vulns if "rule" in v]
+            tx.run("""
+                UNWIND $rows AS row
+                MATCH (v:Vulnerability) WHERE elementId(v) = row.a
+                MATCH (rule:Rule) WHERE elementId(rule) = row.b
+                MERGE (v)-[:VIOLATES]->(rule)
+            """, rows=[{"a": vuln_ids[v["id"]], "b": self._rule_ids[v["rule"]]} for v in kics_vulns])
+
+            tx.run("""
+                UNWIND $rows AS row
+                MATCH (scan:Scan) WHERE elementId(scan) = row.a
+                MATCH (rule:Rule) WHERE elementId(rule) = row.b
+                MERGE (scan)-[:USED_RULE]->(rule)
+            """, rows=[{"a": scan_ids[v["scan_id"]], "b": self._rule_ids[v["rule"]]} for v in kics_vulns])
+
+        with self._session() as session:
+            session.execute_write(write)
 
         print("Created PRs, commits, scans, and vulnerabilities")
 
+    @staticmethod
+    def _has_procedure(session, name: str) -> bool:
+        return session.run(
+            "SHOW PROCEDURES YIELD name WHERE name = $name RETURN count(*) > 0 AS found", name=name
+        ).single()["found"]
+
     def print_stats(self):
         """Print database statistics."""
-        with self.driver.session() as session:
-            result = session.run("""
-                MATCH (n)
-                RETURN labels(n)[0] AS label, count(*) AS count
-                ORDER BY count DESC
-            """)
-            print("\n--- Node Statistics ---")
-            total_nodes = 0
-            for record in result:
-                print(f"  {record['label']}: {record['count']}")
-                total_nodes += record['count']
-            print(f"  TOTAL NODES: {total_nodes}")
-
-            result = session.run("""
-                MATCH ()-[r]->()
-                RETURN type(r) AS type, count(*) AS count
-                ORDER BY count DESC
-            """)
-            print("\n--- Relationship Statistics ---")
-            total_rels = 0
-            for record in result:
-                print(f"  {record['type']}: {record['count']}")
-                total_rels += record['count']
-            print(f"  TOTAL RELATIONSHIPS: {total_rels}")
-            print(f"\n  TOTAL RECORDS: {total_nodes + total_rels}")
+        # Both paths read the count store instead of scanning every node and relationship
+        with self._session() as session:
+            if self._has_procedure(session, "apoc.meta.stats"):
+                stats = session.run("CALL apoc.meta.stats() YIELD labels, relTypesCount").single()
+                node_counts, rel_counts = stats["labels"], stats["relTypesCount"]
+            else:
+                node_counts = {
+                    label: session.run(f"MATCH (n:`{label}`) RETURN count(n) AS count").single()["count"]
+                    for label in session.run("CALL db.labels() YIELD label").value()
+                }
+                rel_counts = {
+                    rel_type: session.run(f"MATCH ()-[r:`{rel_type}`]->() RETURN count(r) AS count").single()["count"]
+                    for rel_type in session.run("CALL db.relationshipTypes() YIELD relationshipType").value()
+                }
+
+        print("\n--- Node Statistics ---")
+        total_nodes = 0
+        for label, count in sorted(node_counts.items(), key=lambda item: item[1], reverse=True):
+            if count:
+                print(f"  {label}: {count}")
+                total_nodes += count
+        print(f"  TOTAL NODES: {total_nodes}")
+
+        print("\n--- Relationship Statistics ---")
+        total_rels = 0
+        for rel_type, count in sorted(rel_counts.items(), key=lambda item: item[1], reverse=True):
+            if count:
+                print(f"  {rel_type}: {count}")
+                total_rels += count
+        print(f"  TOTAL RELATIONSHIPS: {total_rels}")
+        print(f"\n  TOTAL RECORDS: {total_nodes + total_rels}")
 
     def run_demo_queries(self):
         """Run and display demo queries."""
@@ -1003,93 +1079,39 @@ class SecurityGraphSeeder:
         print("DEMO QUERIES")
         print("="*70)
 
-        with self.driver.session() as session:
+        with self._session() as session:
             # Query 1: Which PRs introduced Log4Shell?
             print("\n--- Query 1: Which PRs introduced CVE-2021-44228 (Log4Shell)? ---")
-            result = session.run("""
-                MATCH (r:Repository)-[:HAS_PR]->(pr:PullRequest)
-                      -[:CONTAINS_COMMIT]->(c:Commit)
-                      -[:SCANNED_BY]->(s:Scan)
-                      -[:DETECTED]->(v:Vulnerability)
-                      -[:MAPS_TO]->(cve:CVE {cve_id: 'CVE-2021-44228'})
-                RETURN r.owner + '/' + r.name AS repository,
-                       pr.number AS pr_number,
-                       pr.title AS pr_title,
-                       pr.created_at AS introduced_date
-                ORDER BY pr.created_at
-            """)
-            for record in result:
-                print(f"  {record['repository']} PR#{record['pr_number']}: {record['pr_title'][:50]}...")
+            result = session.run(DEMO_QUERY_INTRODUCED, cve_id="CVE-2021-44228")
+            for repository, pr_number, pr_title, _ in result.values():
+                print(f"  {repository} PR#{pr_number}: {pr_title[:50]}...")
 
             # Query 2: Transitive dependency vulnerabilities
             print("\n--- Query 2: Transitive dependency vulnerabilities ---")
-            result = session.run("""
-                MATCH path = (r:Repository)-[:HAS_DEPENDENCY]->(d1:Dependency)
-                      -[:DEPENDS_ON*1..3]->(d2:Dependency)-[:HAS_CVE]->(cve:CVE)
-                RETURN r.name AS repository,
-                       d1.name + '@' + d1.version AS direct_dep,
-                       d2.name + '@' + d2.version AS vuln_dep,
-                       cve.cve_id AS cve_id,
-                       cve.cvss_score AS cvss_score
-                ORDER BY cve.cvss_score DESC
-                LIMIT 5
-            """)
-            for record in result:
-                print(f"  {record['repository']}: {record['direct_dep']} -> {record['vuln_dep']} ({record['cve_id']}, CVSS: {record['cvss_score']})")
+            result = session.run(DEMO_QUERY_TRANSITIVE)
+            for repository, direct_dep, vuln_dep, cve_id, cvss_score in result.values():
+                print(f"  {repository}: {direct_dep} -> {vuln_dep} ({cve_id}, CVSS: {cvss_score})")
 
             # Query 3: Common vulnerabilities across repos
             print("\n--- Query 3: Common vulnerabilities across repositories ---")
-            result = session.run("""
-                MATCH (r:Repository)-[:HAS_PR]->(:PullRequest)
-                      -[:CONTAINS_COMMIT]->(:Commit)
-                      -[:SCANNED_BY]->(:Scan)
-                      -[:DETECTED]->(v:Vulnerability)
-                      -[:MAPS_TO]->(cve:CVE)
-                WITH cve, collect(DISTINCT r.name) AS affected_repos, count(DISTINCT r) AS repo_count
-                WHERE repo_count > 1
-                RETURN cve.cve_id AS cve_id, cve.cvss_score AS cvss_score, repo_count, affected_repos
-                ORDER BY repo_count DESC, cve.cvss_score DESC
-            """)
-            for record in result:
-                print(f"  {record['cve_id']} (CVSS: {record['cvss_score']}) - {record['repo_count']} repos: {record['affected_repos']}")
+            result = session.run(DEMO_QUERY_COMMON)
+            for cve_id, cvss_score, repo_count, affected_repos in result.values():
+                print(f"  {cve_id} (CVSS: {cvss_score}) - {repo_count} repos: {affected_repos}")
 
             # Query 4: Vulnerability lineage
             print("\n--- Query 4: Vulnerability lineage (payment-service Log4Shell) ---")
-            result = session.run("""
-                MATCH (r:Repository {name: 'payment-service'})-[:HAS_PR]->(pr1:PullRequest)
-                      -[:CONTAINS_COMMIT]->(c1:Commit)
-                      -[:SCANNED_BY]->(:Scan)
-                      -[:DETECTED]->(v:Vulnerability)
-                      -[:MAPS_TO]->(cve:CVE {cve_id: 'CVE-2021-44228'})
-                OPTIONAL MATCH (r)-[:HAS_PR]->(pr2:PullRequest)
-                      -[:CONTAINS_COMMIT]->(c2:Commit)
-                      -[:SCANNED_BY]->(s2:Scan)
-                WHERE pr2.created_at > pr1.created_at
-                  AND s2.scanner = 'BLACKDUCK'
-                  AND NOT EXISTS {
-                    (s2)-[:DETECTED]->(:Vulnerability)-[:MAPS_TO]->(cve)
-                  }
-                WITH pr1, v, cve, pr2
-                ORDER BY pr2.created_at
-                WITH pr1, v, cve, collect(pr2)[0] AS fixing_pr
-                RETURN pr1.number AS introduced_pr,
-                       pr1.created_at AS introduced_date,
-                       fixing_pr.number AS fixed_pr,
-                       fixing_pr.merged_at AS fixed_date,
-                       duration.between(pr1.created_at, fixing_pr.merged_at).days AS days_to_fix
-            """)
-            for record in result:
-                print(f"  Introduced: PR#{record['introduced_pr']} ({str(record['introduced_date'])[:10]})")
-                print(f"  Fixed: PR#{record['fixed_pr']} ({str(record['fixed_date'])[:10]})")
-                print(f"  Days to fix: {record['days_to_fix']}")
+            result = session.run(DEMO_QUERY_LINEAGE, repo="payment-service", cve_id="CVE-2021-44228", scanner="BLACKDUCK")
+            for introduced_pr, introduced_date, fixed_pr, fixed_date, days_to_fix in result.values():
+                print(f"  Introduced: PR#{introduced_pr} ({str(introduced_date)[:10]})")
+                print(f"  Fixed: PR#{fixed_pr} ({str(fixed_date)[:10]})")
+                print(f"  Days to fix: {days_to_fix}")
 
-    def seed_noise(self, count: int = 100):
+    def _generate_noise(self, count: int):
         """
-        Generate noise data for testing.
-        Creates random repositories, PRs, commits, scans, and vulnerabilities.
+        Yield (kind, row) pairs for random repositories and their files, PRs,
+        commits, scans and vulnerabilities. Rows come out parents-first, so any
+        prefix of the stream can be written on its own.
         """
-        print(f"\nGenerating {count} noise records...")
-
         orgs = ["noise-org", "test-corp", "random-inc", "fake-labs", "demo-co"]
         languages = ["python", "java", "go", "rust", "typescript", "ruby"]
         file_types = [
@@ -1098,125 +1120,114 @@ class SecurityGraphSeeder:
             ("docker", "", ["Dockerfile", "docker-compose.yaml"]),
             ("cloudformation", ".json", ["template.json", "stack.json"]),
         ]
+        # File paths are MERGE keys repeated across repos; build each string once
+        infra_paths = {fname: f"infra/{fname}" for _, _, file_names in file_types for fname in file_names}
         severities = ["CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO"]
+        severity_cum_weights = list(accumulate([5, 15, 30, 35, 15]))  # Weighted towards MEDIUM/LOW
         scanners = ["KICS", "BLACKDUCK"]
+        now = datetime.now()
 
         def random_string(length=8):
             return ''.join(random.choices(string.ascii_lowercase, k=length))
 
         def random_date(start_days_ago=365):
             days_ago = random.randint(1, start_days_ago)
-            return datetime.now() - timedelta(days=days_ago)
-
-        with self.driver.session() as session:
-            repos_created = 0
-            prs_created = 0
-            vulns_created = 0
-
-            # Generate random repositories with full graph
-            num_repos = max(count // 10, 5)
-            for i in range(num_repos):
-                org = random.choice(orgs)
-                repo_name = f"{random.choice(languages)}-{random_string()}"
-                repo_id = f"{org}/{repo_name}"
-
-                # Create repository
-                session.run("""
-                    MERGE (r:Repository {owner: $owner, name: $name})
-                    SET r.full_name = $full_name,
-                        r.language = $language,
-                        r.created_at = $created_at,
-                        r.is_noise = true
-                """, owner=org, name=repo_name, full_name=repo_id,
-                    language=random.choice(languages),
-                    created_at=random_date(730).isoformat())
-                repos_created += 1
-
-                # Create random files for this repo
-                infra_type, ext, file_names = random.choice(file_types)
-                for fname in random.sample(file_names, min(len(file_names), random.randint(1, 3))):
-                    file_path = f"infra/{fname}"
-                    session.run("""
-                        MATCH (r:Repository {owner: $owner, name: $name})
-                        MERGE (f:File {path: $path, repository: $repo_id})
-                        SET f.type = $type, f.is_noise = true
-                        MERGE (r)-[:CONTAINS_FILE]->(f)
-                    """, owner=org, name=repo_name, repo_id=repo_id,
-                        path=file_path, type=infra_type)
-
-                # Create PRs for this repo
-                num_prs = random.randint(2, 8)
-                for pr_num in range(1, num_prs + 1):
-                    pr_date = random_date(180)
-                    pr_title = f"{random.choice(['Fix', 'Add', 'Update', 'Refactor'])} {random_string()}"
-
-                    session.run("""
-                        MATCH (r:Repository {owner: $owner, name: $name})
-                        MERGE (pr:PullRequest {repo: $repo_id, number: $pr_num})
-                        SET pr.title = $title,
-                            pr.created_at = $created_at,
-                            pr.merged_at = $merged_at,
-                            pr.is_noise = true
-                        MERGE (r)-[:HAS_PR]->(pr)
-                    """, owner=org, name=repo_name, repo_id=repo_id, pr_num=pr_num + 1000,
-                        title=pr_title, created_at=pr_date.isoformat(),
-                        merged_at=(pr_date + timedelta(days=random.randint(1, 7))).isoformat())
-                    prs_created += 1
-
-                    # Create commit for PR
-                    commit_sha = uuid.uuid4().hex[:40]
-                    session.run("""
-                        MATCH (pr:PullRequest {repo: $repo_id, number: $pr_num})
-                        MERGE (c:Commit {sha: $sha})
-                        SET c.message = $message,
-                            c.created_at = $created_at,
-                            c.is_noise = true
-                        MERGE (pr)-[:CONTAINS_COMMIT]->(c)
-                    """, repo_id=repo_id, pr_num=pr_num + 1000, sha=commit_sha,
-                        message=f"noise commit {random_string()}",
-                        created_at=pr_date.isoformat())
-
-                    # Create scan for commit
-                    scanner = random.choice(scanners)
-                    scan_id = f"scan-{uuid.uuid4().hex[:8]}"
-                    session.run("""
-                        MATCH (c:Commit {sha: $sha})
-                        MERGE (s:Scan {scan_id: $scan_id})
-                        SET s.scanner = $scanner,
-                            s.started_at = $started_at,
-                            s.completed_at = $completed_at,
-                            s.status = 'completed',
-                            s.is_noise = true
-                        MERGE (c)-[:SCANNED_BY]->(s)
-                    """, sha=commit_sha, scan_id=scan_id, scanner=scanner,
-                        started_at=pr_date.isoformat(),
-                        completed_at=(pr_date + timedelta(minutes=random.randint(1, 30))).isoformat())
-
-                    # Create random vulnerabilities
-                    num_vulns = random.randint(0, 5)
-                    for v in range(num_vulns):
-                        vuln_id = f"NOISE-{uuid.uuid4().hex[:8].upper()}"
-                        severity = random.choices(
-                            severities,
-                            weights=[5, 15, 30, 35, 15]  # Weighted towards MEDIUM/LOW
-                        )[0]
-
-                        session.run("""
-                            MATCH (s:Scan {scan_id: $scan_id})
-                            MERGE (v:Vulnerability {vuln_id: $vuln_id})
-                            SET v.severity = $severity,
-                                v.title = $title,
-                                v.description = $description,
-                                v.is_noise = true
-                            MERGE (s)-[:DETECTED]->(v)
-                        """, scan_id=scan_id, vuln_id=vuln_id, severity=severity,
-                            title=f"Noise vulnerability {random_string()}",
-                            description=f"Auto-generated noise vulnerability for testing")
-                        vulns_created += 1
-
-            print(f"  Created {repos_created} noise repositories")
-            print(f"  Created {prs_created} noise PRs with commits and scans")
-            print(f"  Created {vulns_created} noise vulnerabilities")
+            return now - timedelta(days=days_ago)
+
+        # Generate random repositories with full graph
+        num_repos = max(count // 10, 5)
+        for i in range(num_repos):
+            org = random.choice(orgs)
+            repo_name = f"{random.choice(languages)}-{random_string()}"
+            repo_id = f"{org}/{repo_name}"
+            yield "repo", {
+                "owner": org, "name": repo_name, "full_name": repo_id,
+                "language": random.choice(languages),
+                "created_at": random_date(730).isoformat(),
+            }
+
+            # Random files for this repo
+            infra_type, ext, file_names = random.choice(file_types)
+            for fname in random.sample(file_names, min(len(file_names), random.randint(1, 3))):
+                yield "file", {
+                    "owner": org, "name": repo_name, "repo_id": repo_id,
+                    "path": infra_paths[fname], "type": infra_type,
+                }
+
+            # PRs for this repo, each with one commit and one scan
+            num_prs = random.randint(2, 8)
+            for pr_num in range(1, num_prs + 1):
+                pr_date = random_date(180)
+                yield "pr", {
+                    "owner": org, "name": repo_name, "repo_id": repo_id, "pr_num": pr_num + 1000,
+                    "title": f"{random.choice(['Fix', 'Add', 'Update', 'Refactor'])} {random_string()}",
+                    "created_at": pr_date.isoformat(),
+                    "merged_at": (pr_date + timedelta(days=random.randint(1, 7))).isoformat(),
+                }
+
+                commit_sha = os.urandom(20).hex()
+                yield "commit", {
+                    "repo_id": repo_id, "pr_num": pr_num + 1000, "sha": commit_sha,
+                    "message": f"noise commit {random_string()}",
+                    "created_at": pr_date.isoformat(),
+                }
+
+                scan_id = f"scan-{os.urandom(4).hex()}"
+                yield "scan", {
+                    "sha": commit_sha, "scan_id": scan_id, "scanner": random.choice(scanners),
+                    "started_at": pr_date.isoformat(),
+                    "completed_at": (pr_date + timedelta(minutes=random.randint(1, 30))).isoformat(),
+                }
+
+                # Random vulnerabilities, severities drawn in one call per scan
+                num_vulns = random.randint(0, 5)
+                for severity in random.choices(severities, cum_weights=severity_cum_weights, k=num_vulns):
+                    yield "vuln", {
+                        "scan_id": scan_id,
+                        "vuln_id": f"NOISE-{os.urandom(4).hex().upper()}",
+                        "severity": severity,
+                        "title": f"Noise vulnerability {random_string()}",
+                        "description": "Auto-generated noise vulnerability for testing",
+                    }
+
+    def seed_noise(self, count: int = 100):
+        """
+        Generate noise data for testing.
+        Creates random repositories, PRs, commits, scans, and vulnerabilities.
+        """
+        print(f"\nGenerating {count} noise records...")
+        counts = dict.fromkeys(NOISE_QUERIES, 0)
+
+        with self._session() as session:
+            apoc = self._has_procedure(session, "apoc.periodic.iterate")
+            queries = {**NOISE_QUERIES, **NOISE_APOC_NODE_QUERIES} if apoc else NOISE_QUERIES
+
+            # Only BATCH_SIZE rows are held in memory at a time
+            stream = self._generate_noise(count)
+            while chunk := list(islice(stream, BATCH_SIZE)):
+                for kind, query in queries.items():
+                    rows = [row for k, row in chunk if k == kind]
+                    if rows:
+                        session.execute_write(self._unwind, query, rows)
+                        counts[kind] += len(rows)
+
+            if apoc:
+                # Serial batches: the edges share Repository end nodes, so
+                # parallel batches would contend for the same locks
+                for outer, inner in NOISE_APOC_EDGES:
+                    stats = session.run("""
+                        CALL apoc.periodic.iterate($outer, $inner, {batchSize: 10000, parallel: false, retries: 3})
+                        YIELD failedBatches, errorMessages
+                        RETURN failedBatches, errorMessages
+                    """, outer=outer, inner=inner).single()
+                    if stats["failedBatches"]:
+                        raise RuntimeError(
+                            f"apoc.periodic.iterate failed {stats['failedBatches']} batch(es): {stats['errorMessages']}"
+                        )
+
+        print(f"  Created {counts['repo']} noise repositories")
+        print(f"  Created {counts['pr']} noise PRs with commits and scans")
+        print(f"  Created {counts['vuln']} noise vulnerabilities")
 
     def seed_all(self, clear: bool = False, noise: int = 0):
         """Run all seeding operations."""
@@ -1224,12 +1235,17 @@ class SecurityGraphSeeder:
             self.clear_database()
 
         self.create_indexes()
-        self.seed_cves()
-        self.seed_dependencies()
-        self.seed_rules()
-        self.seed_repositories()
-        self.seed_files()
-        self.seed_users()
+        # CVEs, rules, files and users touch disjoint labels, so run them side by side.
+        # Dependencies link to CVEs and repositories link to dependencies, so those
+        # follow in order once CVEs are in.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            cves_future = executor.submit(self.seed_cves)
+            futures = [executor.submit(seed) for seed in (self.seed_rules, self.seed_files, self.seed_users)]
+            cves_future.result()
+            self.seed_dependencies()
+            self.seed_repositories()
+            for future in futures:
+                future.result()
         self.seed_prs_and_scans()
 
         if noise > 0:
@@ -1247,6 +1263,8 @@ def main():
                         help="Neo4j username (default: neo4j)")
     parser.add_argument("--password", default=os.getenv("NEO4J_PASSWORD", "password123"),
                         help="Neo4j password (default: password123)")
+    parser.add_argument("--database", default=os.getenv("NEO4J_DATABASE", DEFAULT_DATABASE),
+                        help=f"Neo4j database name (default: {DEFAULT_DATABASE})")
     parser.add_argument("--clear", action="store_true",
                         help="Clear existing data before seeding")
     parser.add_argument("--demo-only", action="store_true",
@@ -1255,11 +1273,19 @@ def main():
                         help="Generate COUNT noise records (random repos, PRs, vulns)")
     parser.add_argument("--noise-only", type=int, default=0, metavar="COUNT",
                         help="Only generate noise records, skip base demo data")
+    parser.add_argument("--pool-size", type=int, default=DEFAULT_POOL_SIZE,
+                        help=f"Maximum Bolt connection pool size (default: {DEFAULT_POOL_SIZE})")
+    parser.add_argument("--acquire-timeout", type=float, default=DEFAULT_ACQUIRE_TIMEOUT,
+                        help=f"Seconds to wait for a pooled connection (default: {DEFAULT_ACQUIRE_TIMEOUT})")
 
     args = parser.parse_args()
 
     print(f"Connecting to Neo4j at {args.uri}...")
-    seeder = SecurityGraphSeeder(args.uri, args.user, args.password)
+    seeder = SecurityGraphSeeder(args.uri, args.user, args.password,
+                                 pool_size=args.pool_size, acquire_timeout=args.acquire_timeout,
+                                 database=args.database,
+                                 # The demo queries fail loudly enough on their own
+                                 verify=not args.demo_only)
 
     try:
         if args.demo_only:
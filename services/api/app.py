@@ -1,13 +1,14 @@
 import os
 import json
-import uuid
+import secrets
 import redis
+from redis import asyncio as aioredis
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from githubapp import GitHubApp, with_rate_limit_handling
 import logging
 
-from utils import read_file, decode_base64_key
-from model import StoragePayload
+from utils import read_file, decode_base64_key, new_id
 
 # Configure logging
 logging.basicConfig(
@@ -16,8 +17,17 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
-app = FastAPI()
-logger.info(read_file("settings.ini"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await POOL.disconnect()
+
+
+app = FastAPI(lifespan=lifespan)
+SETTINGS = read_file("settings.ini")
+logger.info(SETTINGS)
 
 # Validate required environment variables
 required_env_vars = ["GITHUB_APP_ID", "GITHUB_APP_PRIVATE_KEY", "GITHUB_WEBHOOK_SECRET"]
@@ -38,33 +48,44 @@ github_app = GitHubApp(
 
 github_app.init_app(app, route="/webhooks/github")
 
-Redis = redis.Redis(
-            host=os.getenv("REDIS_HOST", "localhost"),
-            port=int(os.getenv("REDIS_PORT", 6379)),
-            decode_responses=True
-        )
+# Bounded pool shared by all requests; callers wait for a free connection
+POOL = aioredis.BlockingConnectionPool(
+    host=os.getenv("REDIS_HOST", "localhost"),
+    port=int(os.getenv("REDIS_PORT", 6379)),
+    max_connections=int(os.getenv("REDIS_POOL_SIZE", 64)),
+    timeout=5,
+    socket_keepalive=True,
+    health_check_interval=30,
+    decode_responses=True
+)
+Redis = aioredis.Redis(connection_pool=POOL)
+
+# json.dumps builds a new encoder whenever it gets non-default options
+JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+# Storage hashes only need to outlive the scan and its callback
+STORAGE_TTL = int(os.getenv("STORAGE_TTL", 86400))
 
 @app.get("/status")
-def index():
+async def index():
     try:
-        Redis.ping()
+        await Redis.ping()
         redis_status = "ok"
     except redis.ConnectionError:
         redis_status = "error"
     return {"status": "ok", "redis": redis_status}
 
 @app.post("/fanout")
-def fanout(payload: dict = None):
+async def fanout(payload: dict = None):
     payload = payload or {}
 
-    id = str(uuid.uuid7())
+    id = new_id()
     storage = {
         "id": id,
         "name": payload.get("repo", "test-repo"),
         "owner": payload.get("owner", "test-owner"),
         "branch": payload.get("branch", "main"),
         "prId": payload.get("prId", 1),
-        "commit_sha": payload.get("commit_sha") or uuid.uuid4().hex[:40],
+        "commit_sha": payload.get("commit_sha") or secrets.token_hex(20),
         "installation_id": payload.get("installation_id", 0),
     }
 
@@ -73,10 +94,6 @@ def fanout(payload: dict = None):
         "callback_url": "http://api:8000/callback"
     }
 
-    # Store the full payload in Redis for long storage
-    Redis.set(f"storage:{id}", json.dumps(storage))
-    logger.info(f"Storage saved with key: storage:{id}")
-
     # Default streams or custom from payload
     streams_param = payload.get("streams", "")
     if streams_param:
@@ -84,27 +101,42 @@ def fanout(payload: dict = None):
     else:
         streams = ["worker-blackduck", "worker-kics"]
 
-    for stream in streams:
-        Redis.xadd(stream, {"data": json.dumps(worker)})
-        logger.info(f"Message sent to stream: {stream} with id: {id}")
+    # Store the full payload as a hash so readers can fetch just the fields
+    # they need, and fan out to every stream in the same round-trip.
+    # Hash fields must be flat strings; nulls are left out so readers fall
+    # back to their defaults
+    fields = {k: str(v) for k, v in storage.items() if v is not None}
+    message = {"data": JSON_ENCODER.encode(worker)}
+    async with Redis.pipeline(transaction=False) as pipe:
+        pipe.hset(f"storage:{id}", mapping=fields)
+        pipe.expire(f"storage:{id}", STORAGE_TTL)
+        for stream in streams:
+            pipe.xadd(stream, message)
+        await pipe.execute()
+    logger.info("Storage saved with key: storage:%s", id)
+    logger.info("Message sent to streams: %s with id: %s", streams, id)
 
     return {"status": "ok", "streams": streams, "id": id, "storage": storage}
 
 
 @app.post("/callback")
-def callback(payload: dict):
+async def callback(payload: dict):
     id = payload.get("id")
     app_name = payload.get("app_name")
-    msg_base64 = payload.get("msg_base64")
+    v = payload.get("v", 1)
+    if isinstance(v, int) and v >= 2:
+        msg = payload.get("msg")
+    else:
+        # Legacy workers send the message base64-encoded; logged as received
+        msg = payload.get("msg_base64")
 
     # Read storage data by id
-    storage_data = Redis.get(f"storage:{id}")
-    if storage_data:
-        storage = StoragePayload.from_json(storage_data)
-        logger.info(f"Callback from {app_name} - name: {storage.name}, owner: {storage.owner}, branch: {storage.branch}")
-        logger.info(f"Message: {msg_base64}")
+    name, owner, branch = await Redis.hmget(f"storage:{id}", "name", "owner", "branch")
+    if name is not None:
+        logger.info("Callback from %s - name: %s, owner: %s, branch: %s", app_name, name, owner, branch)
+        logger.info("Message: %s", msg)
     else:
-        logger.warning(f"Callback from {app_name} - no storage found for id: {id}")
+        logger.warning("Callback from %s - no storage found for id: %s", app_name, id)
 
     return {"status": "ok", "id": id}
 
@@ -113,9 +145,9 @@ def callback(payload: dict):
 @github_app.on('pull_request.synchronize')
 @with_rate_limit_handling(github_app)
 def handle_pr():
-    # Capture payload immediately to avoid race conditions
-    payload = dict(github_app.payload)
-    print("payload ->> ", payload)
+    # Read the payload once, without copying the whole webhook body
+    p = github_app.payload
+    logger.debug("PR event %s#%s", p.get("repository", {}).get("full_name"), p.get("pull_request", {}).get("number"))
     # Submit to a worker for background processing
     logger.info("PR event accepted for background processing")
     # make request to redis queue
@@ -127,4 +159,4 @@ def handle_pr():
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=int(os.environ.get("PORT", 8000)), log_level="info", reload=True)
+    uvicorn.run(app, host="0.0.0.0", port=int(os.environ.get("PORT", 8000)), loop="uvloop", http="httptools", log_level="info")
@@ -1,12 +1,28 @@
 # -*- coding: utf-8 -*-
 
 import json
+import time
 import logging
 import base64
+import secrets
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Built once; json.dumps would construct a new encoder for every call with options
+_PRETTY_ENCODER = json.JSONEncoder(indent=4, default=str)
+
+
+def new_id():
+    """
+    Generate a time-ordered id.
+
+    Returns:
+        str: 13 hex digits of epoch milliseconds followed by 12 random hex
+        digits, so ids sort by creation time like UUIDv7
+    """
+    return f"{time.time_ns() // 1_000_000:013x}{secrets.token_hex(6)}"
+
 
 def parse_datetime(dt_value):
     """
@@ -21,16 +37,12 @@ def parse_datetime(dt_value):
     if isinstance(dt_value, datetime):
         return dt_value
     if isinstance(dt_value, str):
-        # Try ISO format first (most common)
+        # fromisoformat (3.11+) accepts 'Z', fractional seconds and a space
+        # separator, which covers every format the strptime fallbacks handled
         try:
-            return datetime.fromisoformat(dt_value.replace('Z', '+00:00'))
-        except (ValueError, AttributeError):
-            # Fallback to common formats
-            for fmt in ['%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S.%fZ']:
-                try:
-                    return datetime.strptime(dt_value, fmt)
-                except ValueError:
-                    continue
+            return datetime.fromisoformat(dt_value)
+        except ValueError:
+            pass
     return dt_value
 
 def decode_base64_key(encoded_key):
@@ -57,7 +69,7 @@ def decode_base64_key(encoded_key):
 
 
 def json_prettify(data):
-    return json.dumps(data, indent=4, default=str)
+    return _PRETTY_ENCODER.encode(data)
 
 def read_file(file_path):
     with open(file_path, 'r', encoding='utf-8') as file:
@@ -1,15 +1,20 @@
 #!/usr/bin/env python3
 """
-Ephemeral Blackduck Worker - processes ONE message then exits.
-Docker restart policy handles the restart.
+Recycling Blackduck Worker - processes up to MAX_JOBS messages (or until
+its RSS exceeds MAX_RSS_MB) then exits, keeping the Redis and HTTP
+connection pools warm in between. Docker restart policy handles the restart.
 """
+import gc
 import os
 import sys
 import time
+import resource
+import signal
 import redis
 import logging
 from model import MessagePayload
-from processor import Processor
+from processor import Processor, WORKER_TMP
+from github import reap_clones
 from scan import check_blackduck_installed, BlackduckNotFoundError
 
 logging.basicConfig(
@@ -22,11 +27,38 @@ STREAM_NAME = os.getenv("STREAM_NAME", "worker-blackduck")
 APP_NAME = os.getenv("APP_NAME", "blackduck-worker")
 CONSUMER_GROUP = os.getenv("CONSUMER_GROUP", "workers")
 CONSUMER_NAME = os.getenv("CONSUMER_NAME", APP_NAME or "consumer-1")
+BATCH_SIZE = int(os.getenv("BATCH_SIZE", 1))
+READ_BLOCK_MS = int(os.getenv("READ_BLOCK_MS", 5000))
+CLONE_MAX_AGE_MIN = int(os.getenv("CLONE_MAX_AGE_MIN", 60))
+MIN_DISK_FREE_MB = int(os.getenv("MIN_DISK_FREE_MB", 0))
+MAX_JOBS = int(os.getenv("MAX_JOBS", 100))
+MAX_RSS_MB = int(os.getenv("MAX_RSS_MB", 0))
+
+
+def rss_mb() -> float:
+    """Peak resident set size of this process (ru_maxrss is KiB on Linux)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
 
 
 def main():
     logger.info(f"[{APP_NAME}] Starting Blackduck Worker...")
 
+    # A worker killed mid-scan skips its cleanup; the restarted container
+    # still has the clone, so sweep leftovers before taking new work
+    reap_clones(WORKER_TMP, CLONE_MAX_AGE_MIN * 60, MIN_DISK_FREE_MB, APP_NAME, CONSUMER_NAME)
+
+    # Connect to Redis through a bounded pool with keepalive
+    pool = redis.BlockingConnectionPool(
+        host=os.getenv("REDIS_HOST", "localhost"),
+        port=int(os.getenv("REDIS_PORT", 6379)),
+        max_connections=int(os.getenv("REDIS_POOL_SIZE", 4)),
+        timeout=5,
+        socket_keepalive=True,
+        health_check_interval=30,
+        decode_responses=True
+    )
+    r = redis.Redis(connection_pool=pool)
+
     # Check Blackduck is installed
     try:
         blackduck_version = check_blackduck_installed()
@@ -35,13 +67,6 @@ def main():
         logger.error(f"[{APP_NAME}] Blackduck not found: {e}")
         sys.exit(1)
 
-    # Connect to Redis
-    r = redis.Redis(
-        host=os.getenv("REDIS_HOST", "localhost"),
-        port=int(os.getenv("REDIS_PORT", 6379)),
-        decode_responses=True
-    )
-
     # Ensure consumer group exists
     try:
         r.xgroup_create(STREAM_NAME, CONSUMER_GROUP, id="0", mkstream=True)
@@ -51,38 +76,72 @@ def main():
             raise
         logger.info(f"[{APP_NAME}] Consumer group {CONSUMER_GROUP} already exists")
 
-    processor = Processor(APP_NAME, r)
+    processor = Processor(APP_NAME, r, CONSUMER_NAME)
     logger.info(f"[{APP_NAME}] Listening on stream: {STREAM_NAME}")
 
-    # Main loop - wait for ONE message, process it, then exit
+    # SIGTERM exits straight away while idle; mid-batch it lets the batch
+    # finish and be acknowledged first
+    stopping = False
+
+    # Only flags the stop: exiting from the handler could land between the
+    # read and the ack and strand delivered entries in the pending list
+    def on_sigterm(signum, frame):
+        nonlocal stopping
+        stopping = True
+        logger.info("[%s] SIGTERM received, finishing current batch", APP_NAME)
+
+    signal.signal(signal.SIGTERM, on_sigterm)
+
+    # Main loop - process batches until the job or memory budget is spent
+    jobs_done = 0
     while True:
+        if stopping:
+            logger.info("[%s] Stopping after %d jobs", APP_NAME, jobs_done)
+            sys.exit(0)
         try:
+            # A bounded block lets an idle worker notice the stop flag
             messages = r.xreadgroup(
                 CONSUMER_GROUP, CONSUMER_NAME,
                 {STREAM_NAME: ">"},
-                block=5000, count=1
+                block=READ_BLOCK_MS, count=BATCH_SIZE
             )
 
-            if not messages:
-                continue
-
-            for stream, entries in messages:
-                for entry_id, data in entries:
-                    msg = MessagePayload.message(data)
-                    logger.info(f"[{APP_NAME}] Received: {msg}")
-
-                    processor.process(msg)
-
-                    r.xack(STREAM_NAME, CONSUMER_GROUP, entry_id)
-                    r.xdel(STREAM_NAME, entry_id)
-                    logger.info(f"[{APP_NAME}] Done. Exiting for clean restart.")
-                    sys.exit(0)  # Exit cleanly, Docker will restart
+            acked = []
+            try:
+                for stream, entries in messages:
+                    for entry_id, data in entries:
+                        # A failed entry must not strand the rest of the batch
+                        # in the pending list; nothing reclaims entries, so it
+                        # is logged and acknowledged like the others
+                        try:
+                            msg = MessagePayload.message(data)
+                            logger.info("[%s] Received: %r", APP_NAME, msg)
+                            processor.process(msg)
+                        except Exception:
+                            logger.exception("[%s] Failed to process entry %s", APP_NAME, entry_id)
+                        acked.append(entry_id)
+                        jobs_done += 1
+                        gc.collect()
+            finally:
+                try:
+                    # Acknowledge the whole batch in one flush
+                    if acked:
+                        with r.pipeline(transaction=False) as pipe:
+                            pipe.xack(STREAM_NAME, CONSUMER_GROUP, *acked)
+                            pipe.xdel(STREAM_NAME, *acked)
+                            pipe.execute()
+                finally:
+                    # Checked even when the batch raised, so a SIGTERM received
+                    # mid-batch still ends the worker
+                    if stopping or jobs_done >= MAX_JOBS or (MAX_RSS_MB and rss_mb() > MAX_RSS_MB):
+                        logger.info("[%s] Done after %d jobs (%.0f MB RSS). Exiting for clean restart.", APP_NAME, jobs_done, rss_mb())
+                        sys.exit(0)  # Exit cleanly, Docker will restart
 
         except redis.ConnectionError as e:
-            logger.error(f"[{APP_NAME}] Redis connection error: {e}")
+            logger.error("[%s] Redis connection error: %s", APP_NAME, e)
             time.sleep(5)
         except Exception as e:
-            logger.error(f"[{APP_NAME}] Error: {e}")
+            logger.error("[%s] Error: %s", APP_NAME, e)
             time.sleep(1)
 
 
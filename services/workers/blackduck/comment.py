@@ -1,5 +1,9 @@
+import heapq
+
 from scan import ScanResult
 
+SEVERITY_ORDER = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
+
 
 class Comment:
     """Builds markdown comments and summaries for GitHub."""
@@ -33,11 +37,12 @@ class Comment:
         if not result.success:
             return f"Scan failed: {result.error_message}"
 
+        counters = result.severity_counters
         return (
             f"Blackduck scan completed: {result.total_issues} vulnerabilities found "
-            f"(CRITICAL={result.severity_counters.get('CRITICAL', 0)}, "
-            f"HIGH={result.severity_counters.get('HIGH', 0)}, "
-            f"MEDIUM={result.severity_counters.get('MEDIUM', 0)})"
+            f"(CRITICAL={counters.get('CRITICAL', 0)}, "
+            f"HIGH={counters.get('HIGH', 0)}, "
+            f"MEDIUM={counters.get('MEDIUM', 0)})"
         )
 
     def _severity_table(self, counters: dict) -> str:
@@ -63,19 +68,14 @@ class Comment:
         if not vulnerabilities:
             return "✅ **No vulnerabilities found!**"
 
-        # Sort by severity
-        severity_order = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
-        sorted_vulns = sorted(
-            vulnerabilities,
-            key=lambda v: severity_order.get(
-                v.get("severity", v.get("vulnerabilitySeverity", "LOW")).upper(), 4
-            )
-        )
+        # Severity is normalised by Scan._parse_results; keep only the top
+        # max_items (nsmallest is stable, matching sorted(...)[:max_items])
+        top = heapq.nsmallest(max_items, vulnerabilities, key=lambda v: SEVERITY_ORDER.get(v["severity"], 4))
 
         lines = ["### Top Vulnerabilities", ""]
 
-        for vuln in sorted_vulns[:max_items]:
-            severity = vuln.get("severity", vuln.get("vulnerabilitySeverity", "UNKNOWN")).upper()
+        for vuln in top:
+            severity = vuln["severity"]
             name = vuln.get("name", vuln.get("componentName", "Unknown"))
             version = vuln.get("version", vuln.get("componentVersion", ""))
             cve = vuln.get("cve", vuln.get("vulnerabilityId", ""))
@@ -1,20 +1,68 @@
 import os
-import base64
+import time
 import random
+import hashlib
 import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from model import StoragePayload
 from scan import Scan, ScanResult
 from github import GitHub
+from ratelimit import GitHubRateLimiter
 from comment import Comment
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive session for coordinator callbacks, reused across messages
+SESSION = requests.Session()
+# The coordinator callback only logs, so retrying the POST on overload is safe
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=frozenset({"POST"})
+    )
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
 # Test mode: clone public repo instead of target repo (for testing/rate limiting)
 TEST_MODE = os.getenv("TEST_MODE", "").lower() in ("true", "1", "yes")
 # Debug output: print comment/results to terminal before posting
 DEBUG_OUTPUT = os.getenv("DEBUG_OUTPUT", "").lower() in ("true", "1", "yes")
+GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "")
+# Scratch root for clones and scan output; point at a tmpfs mount to keep
+# the clone/scan I/O off the container's overlay filesystem
+WORKER_TMP = os.getenv("WORKER_TMP") or None
+# Extra tokens to rotate through; each is scored by its remaining API budget
+GITHUB_TOKENS = [t.strip() for t in os.getenv("GITHUB_TOKENS", "").split(",") if t.strip()]
+TOKEN_POOL_KEY = "github:tokens"
+# Window reset time per pooled token, alongside its score
+TOKEN_RESET_KEY = "github:tokens:reset"
+TOKEN_MIN_BUDGET = 100
+TOKEN_FULL_BUDGET = 5000
+
+
+def token_id(token: str) -> str:
+    """Redis member for a pooled token; the secret itself stays in the environment."""
+    return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+
+TOKENS_BY_ID = {token_id(t): t for t in GITHUB_TOKENS}
+# One limiter per token, shared by every GitHub client in this process
+LIMITERS: dict[str, GitHubRateLimiter] = {}
+SEVERITY_TO_LEVEL = {
+    "CRITICAL": "failure",
+    "HIGH": "failure",
+    "MEDIUM": "warning",
+    "LOW": "warning",
+}
 TEST_REPOS = [
     {"owner": "juice-shop", "name": "juice-shop", "branch": "master"},  # https://github.com/juice-shop/juice-shop
     {"owner": "OWASP", "name": "WebGoat", "branch": "main"},  # https://github.com/OWASP/WebGoat
@@ -26,10 +74,14 @@ TEST_REPOS = [
 class Processor:
     """Orchestrates the scan workflow: clone, scan, report, cleanup."""
 
-    def __init__(self, app_name: str, redis_client):
+    def __init__(self, app_name: str, redis_client, consumer_name: str = ""):
         self.app_name = app_name
+        self.consumer_name = consumer_name
         self.redis = redis_client
         self.comment = Comment(app_name)
+        if TOKENS_BY_ID:
+            # Seed new tokens with a full hourly budget; keep known scores
+            self.redis.zadd(TOKEN_POOL_KEY, {i: TOKEN_FULL_BUDGET for i in TOKENS_BY_ID}, nx=True)
 
     def process(self, msg):
         """
@@ -50,7 +102,12 @@ class Processor:
 
         # Initialize GitHub client
         github_token = self._get_github_token(storage.installation_id)
-        github = GitHub(github_token, self.app_name)
+        limiter = LIMITERS.get(github_token)
+        if limiter is None:
+            limiter = LIMITERS[github_token] = GitHubRateLimiter(
+                on_update=lambda remaining, reset_at: self._record_budget(github_token, remaining, reset_at)
+            )
+        github = GitHub(github_token, self.app_name, limiter=limiter)
 
         ctx = None
         try:
@@ -63,7 +120,9 @@ class Processor:
                     name=test_repo["name"],
                     branch=test_repo["branch"],
                     pr_id=storage.prId,
-                    commit_sha=storage.commit_sha
+                    commit_sha=storage.commit_sha,
+                    tmp_root=WORKER_TMP,
+                    tag=self.consumer_name
                 )
                 # Override owner/name for posting to original repo
                 ctx.owner = storage.owner
@@ -74,7 +133,9 @@ class Processor:
                     name=storage.name,
                     branch=storage.branch,
                     pr_id=storage.prId,
-                    commit_sha=storage.commit_sha
+                    commit_sha=storage.commit_sha,
+                    tmp_root=WORKER_TMP,
+                    tag=self.consumer_name
                 )
 
             # 3. Run scan
@@ -82,7 +143,7 @@ class Processor:
             project_name = f"{storage.owner}/{storage.name}"
             result = scanner.run(ctx.path, project_name)
 
-            # 4. Post PR comment
+            # 4. Build PR comment
             pr_comment = self.comment.pr_comment(result)
             if DEBUG_OUTPUT:
                 print(f"\n{'='*60}", flush=True)
@@ -90,24 +151,37 @@ class Processor:
                 print('='*60, flush=True)
                 print(pr_comment, flush=True)
                 print('='*60 + "\n", flush=True)
-            github.post_pr_comment(ctx, pr_comment)
 
-            # 5. Create check run with annotations
+            # 5. Build check run with annotations
             check_summary = self.comment.check_run_summary(result)
             if DEBUG_OUTPUT:
                 print(f"CHECK RUN: {check_summary}", flush=True)
-            github.create_check_run(
-                ctx=ctx,
-                name="Blackduck Security Scan",
-                conclusion=self._determine_conclusion(result),
-                title="Blackduck Security Scan Results",
-                summary=check_summary,
-                annotations=self._build_annotations(result)
-            )
 
-            # 6. Send callback to coordinator
-            if msg.callback_url:
-                self._send_callback(msg.callback_url, msg.id, self.comment.callback_message(result))
+            conclusion = self._determine_conclusion(result)
+            annotations = self._build_annotations(result)
+            callback_msg = self.comment.callback_message(result)
+            # Everything posted below is rendered; release the raw findings
+            # before the network phase
+            del result
+
+            # 4-6. GitHub calls for one token stay serial to avoid secondary
+            # rate limits; only the coordinator callback overlaps with them
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                callback = None
+                if msg.callback_url:
+                    # 6. Send callback to coordinator
+                    callback = executor.submit(self._send_callback, msg.callback_url, msg.id, callback_msg)
+                github.post_pr_comment(ctx, pr_comment)
+                github.create_check_run(
+                    ctx=ctx,
+                    name="Blackduck Security Scan",
+                    conclusion=conclusion,
+                    title="Blackduck Security Scan Results",
+                    summary=check_summary,
+                    annotations=annotations
+                )
+                if callback:
+                    callback.result()
 
         finally:
             # 7. Cleanup
@@ -116,10 +190,10 @@ class Processor:
 
     def _retrieve_storage(self, id: str) -> StoragePayload | None:
         """Retrieve storage data from Redis."""
-        storage_data = self.redis.get(f"storage:{id}")
+        storage_data = self.redis.hgetall(f"storage:{id}")
 
         if storage_data:
-            storage = StoragePayload.from_json(storage_data)
+            storage = StoragePayload.from_hash(storage_data)
             logger.info(f"[{self.app_name}] Fetched storage: name={storage.name}, owner={storage.owner}, branch={storage.branch}")
             return storage
 
@@ -132,13 +206,54 @@ class Processor:
 
         TODO: Implement GitHub App token generation
         """
-        token = os.getenv("GITHUB_TOKEN", "")
+        token = self._pick_pooled_token() or GITHUB_TOKEN
 
         if not token and installation_id:
             logger.warning(f"[{self.app_name}] No GitHub token, installation_id={installation_id}")
 
         return token
 
+    def _pick_pooled_token(self) -> str:
+        """Pick the pooled token with the most remaining budget, if any."""
+        if not TOKENS_BY_ID:
+            return ""
+        with self.redis.pipeline(transaction=False) as pipe:
+            pipe.zrange(TOKEN_POOL_KEY, 0, -1, withscores=True)
+            pipe.hgetall(TOKEN_RESET_KEY)
+            scores, resets = pipe.execute()
+
+        now = time.time()
+        budgets = {}
+        for member, score in scores:
+            if member not in TOKENS_BY_ID:
+                continue
+            # A score recorded before its window reset no longer applies
+            reset_at = float(resets.get(member, 0))
+            budgets[member] = TOKEN_FULL_BUDGET if reset_at and reset_at <= now else score
+        if not budgets:
+            return ""
+
+        healthy = [m for m, budget in budgets.items() if budget >= TOKEN_MIN_BUDGET]
+        if healthy:
+            best = max(healthy, key=budgets.get)
+        else:
+            # Every token is under budget; take the one that resets first
+            best = min(budgets, key=lambda m: float(resets.get(m, 0)))
+        return TOKENS_BY_ID[best]
+
+    def _record_budget(self, token: str, remaining: int, reset_at: float):
+        """Update a pooled token's score and reset time from the latest rate-limit headers."""
+        member = token_id(token)
+        if member not in TOKENS_BY_ID:
+            return
+        try:
+            with self.redis.pipeline(transaction=False) as pipe:
+                pipe.zadd(TOKEN_POOL_KEY, {member: remaining}, xx=True)
+                pipe.hset(TOKEN_RESET_KEY, member, reset_at)
+                pipe.execute()
+        except Exception as e:
+            logger.warning(f"[{self.app_name}] Failed to record token budget: {e}")
+
     def _determine_conclusion(self, result: ScanResult) -> str:
         """Determine check run conclusion based on results."""
         if not result.success:
@@ -154,17 +269,10 @@ class Processor:
         # Blackduck vulnerabilities are typically component-level, not file-level
         # So we create summary annotations rather than line-specific ones
         annotations = []
-
-        severity_to_level = {
-            "CRITICAL": "failure",
-            "HIGH": "failure",
-            "MEDIUM": "warning",
-            "LOW": "warning",
-        }
+        get_level = SEVERITY_TO_LEVEL.get
 
         for vuln in result.vulnerabilities[:50]:  # Limit to 50
-            severity = vuln.get("severity", vuln.get("vulnerabilitySeverity", "LOW")).upper()
-            level = severity_to_level.get(severity, "notice")
+            level = get_level(vuln["severity"], "notice")
             name = vuln.get("name", vuln.get("componentName", "Unknown"))
             cve = vuln.get("cve", vuln.get("vulnerabilityId", ""))
 
@@ -187,13 +295,15 @@ class Processor:
         if not callback_url:
             return
 
+        # v2 sends the message as plain text; v1 readers expect msg_base64
         payload = {
             "id": id,
-            "msg_base64": base64.b64encode(msg.encode()).decode(),
-            "app_name": self.app_name
+            "msg": msg,
+            "app_name": self.app_name,
+            "v": 2
         }
         try:
-            response = requests.post(callback_url, json=payload, timeout=10)
+            response = SESSION.post(callback_url, json=payload, timeout=10)
             logger.info(f"[{self.app_name}] Callback sent: {response.status_code}")
         except requests.RequestException as e:
             logger.error(f"[{self.app_name}] Callback failed: {e}")
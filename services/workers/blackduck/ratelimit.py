@@ -0,0 +1,98 @@
+import time
+import random
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class GitHubRateLimiter:
+    """Paces GitHub API calls from the rate-limit headers on each response."""
+
+    def __init__(self, buffer: int = 100, max_retries: int = 3, on_update=None):
+        self.buffer = buffer
+        self.max_retries = max_retries
+        self.on_update = on_update
+        # Limiters live for the whole process, so their keep-alive pool
+        # carries the TLS connection to api.github.com across scans.
+        # Retries stay here rather than in urllib3: check-run POSTs are
+        # not idempotent
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        self.remaining: int | None = None
+        self.reset_at = 0.0
+        # Limiters are shared per token across threads
+        self._lock = threading.Lock()
+
+    def send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request, waiting for the window to reset when the remaining
+        budget drops under the buffer and backing off when rate limited.
+        """
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_budget()
+            response = self.session.request(method, url, **kwargs)
+            self._update(response)
+
+            if not self._is_rate_limited(response) or attempt == self.max_retries:
+                return response
+
+            delay = self._retry_after(response)
+            if delay is None:
+                delay = 2 ** attempt + random.random()
+            logger.warning("GitHub rate limit hit (%s), retrying in %.1fs", response.status_code, delay)
+            time.sleep(delay)
+
+        return response
+
+    def _wait_for_budget(self):
+        """Sleep until the window resets if the remaining budget is low."""
+        # Held while sleeping so every caller waits for the same reset
+        with self._lock:
+            if self.remaining is not None and self.remaining < self.buffer:
+                delay = max(0.0, self.reset_at - time.time())
+                if delay:
+                    logger.warning("GitHub budget low (%s left), sleeping %.0fs until reset", self.remaining, delay)
+                    time.sleep(delay)
+                self.remaining = None
+
+    def _update(self, response: requests.Response):
+        """Record the budget reported by GitHub."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        with self._lock:
+            if reset is not None:
+                self.reset_at = float(reset)
+            if remaining is not None:
+                self.remaining = int(remaining)
+            reset_at = self.reset_at
+        if remaining is not None and self.on_update:
+            self.on_update(int(remaining), reset_at)
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> float | None:
+        """Seconds to wait from Retry-After, given as seconds or an HTTP date."""
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _is_rate_limited(response: requests.Response) -> bool:
+        """Primary and secondary limits surface as 429 or 403."""
+        if response.status_code == 429:
+            return True
+        if response.status_code == 403:
+            return response.headers.get("X-RateLimit-Remaining") == "0" or "rate limit" in response.text.lower()
+        return False
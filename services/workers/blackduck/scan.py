@@ -2,13 +2,16 @@ import os
 import json
 import logging
 import subprocess
+from collections import Counter
 from dataclasses import dataclass
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+SCAN_TIMEOUT_S = int(os.getenv("SCAN_TIMEOUT_S", 1800))
 
-@dataclass
+
+@dataclass(slots=True)
 class ScanResult:
     """Blackduck scan result."""
     success: bool
@@ -52,6 +55,14 @@ def check_blackduck_installed() -> str:
         raise BlackduckNotFoundError("Blackduck CLI version check timed out")
 
 
+def _tail(path: str, size: int = 4096) -> str:
+    """Return the last size bytes of a log file as text."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - size))
+        return f.read().decode(errors="replace")
+
+
 class Scan:
     """Blackduck security scanner. Only handles scanning, no Git/GitHub operations."""
 
@@ -123,14 +134,24 @@ class Scan:
             f"--blackduck.output.path={output_path}",
         ])
 
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=repo_path)
+        # Stream output to disk instead of buffering it in memory
+        log_path = os.path.join(output_path, "bridge-cli.log")
+        with open(log_path, "wb") as log_file:
+            process = subprocess.Popen(cmd, stdout=log_file, stderr=subprocess.STDOUT, cwd=repo_path)
+            try:
+                returncode = process.wait(timeout=SCAN_TIMEOUT_S)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                raise RuntimeError(f"Blackduck scan timed out after {SCAN_TIMEOUT_S}s: {_tail(log_path)}")
 
-        logger.info(f"[{self.app_name}] Blackduck completed with exit code {result.returncode}")
+        logger.info(f"[{self.app_name}] Blackduck completed with exit code {returncode}")
 
-        if result.stderr:
-            logger.debug(f"[{self.app_name}] Blackduck stderr: {result.stderr}")
+        # The tail is a file read, so skip it unless debug output is on
+        if returncode != 0 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] Blackduck output: %s", self.app_name, _tail(log_path))
 
-        return result.returncode
+        return returncode
 
     def _parse_results(self, results_file: str, exit_code: int) -> ScanResult:
         """Parse Blackduck results file."""
@@ -155,10 +176,14 @@ class Scan:
                 )
 
         try:
-            with open(results_file) as f:
+            # json.load takes the bytes directly, skipping the text-mode decode layer
+            with open(results_file, "rb") as f:
                 data = json.load(f)
 
             vulnerabilities = data.get("vulnerabilities", data.get("components", []))
+            # Normalise severity once so downstream code reads a plain key
+            for vuln in vulnerabilities:
+                vuln["severity"] = (vuln.get("severity") or vuln.get("vulnerabilitySeverity") or "UNKNOWN").upper()
             severity_counters = self._count_severities(vulnerabilities)
 
             return ScanResult(
@@ -185,9 +210,5 @@ class Scan:
 
     def _count_severities(self, vulnerabilities: list) -> dict:
         """Count vulnerabilities by severity."""
-        counters = {"CRITICAL": 0, "HIGH": 0, "MEDIUM": 0, "LOW": 0}
-        for vuln in vulnerabilities:
-            severity = vuln.get("severity", vuln.get("vulnerabilitySeverity", "UNKNOWN")).upper()
-            if severity in counters:
-                counters[severity] += 1
-        return counters
+        counts = Counter(vuln["severity"] for vuln in vulnerabilities)
+        return {k: counts[k] for k in ("CRITICAL", "HIGH", "MEDIUM", "LOW")}
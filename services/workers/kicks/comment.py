@@ -1,5 +1,9 @@
+from operator import itemgetter
+
 from scan import ScanResult
 
+SEVERITY_ORDER = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3, "INFO": 4}
+
 
 class Comment:
     """Builds markdown comments and summaries for GitHub."""
@@ -33,11 +37,12 @@ class Comment:
         if not result.success:
             return f"Scan failed: {result.error_message}"
 
+        counters = result.severity_counters
         return (
             f"KICS scan completed: {result.total_issues} issues found "
-            f"(CRITICAL={result.severity_counters.get('CRITICAL', 0)}, "
-            f"HIGH={result.severity_counters.get('HIGH', 0)}, "
-            f"MEDIUM={result.severity_counters.get('MEDIUM', 0)})"
+            f"(CRITICAL={counters.get('CRITICAL', 0)}, "
+            f"HIGH={counters.get('HIGH', 0)}, "
+            f"MEDIUM={counters.get('MEDIUM', 0)})"
         )
 
     def _severity_table(self, counters: dict) -> str:
@@ -65,21 +70,21 @@ class Comment:
         if not queries:
             return "✅ **No issues found!**"
 
-        severity_order = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3, "INFO": 4}
-        sorted_queries = sorted(
-            queries,
-            key=lambda q: severity_order.get(q.get("severity", "INFO"), 5)
-        )
+        # Look up each severity once and sort on the precomputed rank
+        keyed = []
+        for query in queries:
+            severity = query.get("severity", "INFO")
+            keyed.append((SEVERITY_ORDER.get(severity, 5), severity, query))
+        keyed.sort(key=itemgetter(0))
 
         lines = ["### Top Issues", ""]
         count = 0
 
-        for query in sorted_queries:
+        for _, severity, query in keyed:
             if count >= max_issues:
                 lines.append(f"\n*...and more issues*")
                 break
 
-            severity = query.get("severity", "INFO")
             name = query.get("query_name", "Unknown")
 
             for file in query.get("files", [])[:3]:
@@ -2,7 +2,16 @@ import json
 from dataclasses import dataclass
 from typing import Dict, Any
 
-@dataclass
+
+def _to_int(value) -> int:
+    """Parse an integer hash field, treating anything unparseable as 0."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+@dataclass(slots=True)
 class MessagePayload:
     """Parse worker message from stream."""
     id: str
@@ -20,7 +29,7 @@ class MessagePayload:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StoragePayload:
     """Parse storage data from Redis."""
     id: str
@@ -32,15 +41,14 @@ class StoragePayload:
     installation_id: int
 
     @classmethod
-    def from_json(cls, data: str) -> 'StoragePayload':
-        """Create StoragePayload from JSON string."""
-        parsed = json.loads(data)
+    def from_hash(cls, fields: dict) -> 'StoragePayload':
+        """Create StoragePayload from a Redis hash."""
         return cls(
-            id=parsed.get('id', ''),
-            name=parsed.get('name', ''),
-            owner=parsed.get('owner', ''),
-            branch=parsed.get('branch', ''),
-            prId=parsed.get('prId', 0),
-            commit_sha=parsed.get('commit_sha', ''),
-            installation_id=parsed.get('installation_id', 0)
+            id=fields.get('id', ''),
+            name=fields.get('name', ''),
+            owner=fields.get('owner', ''),
+            branch=fields.get('branch', ''),
+            prId=_to_int(fields.get('prId')),
+            commit_sha=fields.get('commit_sha', ''),
+            installation_id=_to_int(fields.get('installation_id'))
         )
@@ -2,13 +2,27 @@ import os
 import json
 import logging
 import subprocess
-from dataclasses import dataclass
+from datetime import datetime
+from dataclasses import dataclass, field
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+SCAN_TIMEOUT_S = int(os.getenv("SCAN_TIMEOUT_S", 1800))
+# The only query/file keys the comment and annotations read; KICS also
+# emits URLs, search keys and expected/actual values for every finding
+QUERY_FIELDS = ("severity", "query_name", "description")
+FILE_FIELDS = ("file_name", "line")
+SEVERITY_TO_LEVEL = {
+    "CRITICAL": "failure",
+    "HIGH": "failure",
+    "MEDIUM": "warning",
+    "LOW": "warning",
+    "INFO": "notice"
+}
+
+
+@dataclass(slots=True)
 class ScanResult:
     """KICS scan result."""
     success: bool
@@ -20,6 +34,7 @@ class ScanResult:
     execution_time_seconds: float
     queries: list
     error_message: Optional[str] = None
+    annotations: list = field(default_factory=list)
 
 
 class KicsNotFoundError(Exception):
@@ -53,6 +68,14 @@ def check_kics_installed() -> str:
         raise KicsNotFoundError("KICS version check timed out")
 
 
+def _tail(path: str, size: int = 4096) -> str:
+    """Return the last size bytes of a log file as text."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - size))
+        return f.read().decode(errors="replace")
+
+
 class Scan:
     """KICS security scanner. Only handles scanning, no Git/GitHub operations."""
 
@@ -106,14 +129,24 @@ class Scan:
             "--report-formats", "json"
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # Stream output to disk instead of buffering it in memory
+        log_path = os.path.join(output_path, "kics.log")
+        with open(log_path, "wb") as log_file:
+            process = subprocess.Popen(cmd, stdout=log_file, stderr=subprocess.STDOUT)
+            try:
+                returncode = process.wait(timeout=SCAN_TIMEOUT_S)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                raise RuntimeError(f"KICS scan timed out after {SCAN_TIMEOUT_S}s: {_tail(log_path)}")
 
-        logger.info(f"[{self.app_name}] KICS completed with exit code {result.returncode}")
+        logger.info(f"[{self.app_name}] KICS completed with exit code {returncode}")
 
-        if result.stderr:
-            logger.debug(f"[{self.app_name}] KICS stderr: {result.stderr}")
+        # The tail is a file read, so skip it unless debug output is on
+        if returncode != 0 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] KICS output: %s", self.app_name, _tail(log_path))
 
-        return result.returncode
+        return returncode
 
     def _parse_results(self, results_file: str, exit_code: int) -> ScanResult:
         """Parse KICS JSON results file."""
@@ -130,9 +163,11 @@ class Scan:
                 error_message="No results file generated"
             )
 
-        with open(results_file) as f:
+        # json.load takes the bytes directly, skipping the text-mode decode layer
+        with open(results_file, "rb") as f:
             data = json.load(f)
 
+        queries, annotations = self._collect_queries(data.get("queries", []))
         return ScanResult(
             success=True,
             total_issues=data.get("total_counter", 0),
@@ -141,15 +176,57 @@ class Scan:
             files_parsed=data.get("files_parsed", 0),
             queries_total=data.get("queries_total", 0),
             execution_time_seconds=self._calculate_duration(data),
-            queries=data.get("queries", [])
+            queries=queries,
+            annotations=annotations
         )
 
+    def _collect_queries(self, queries: list) -> tuple[list, list]:
+        """
+        Keep only the fields read downstream so the full results DOM is
+        freed as soon as parsing returns instead of being held by ScanResult,
+        and build the GitHub annotations, one per query and location, in the
+        same pass.
+        """
+        slim = []
+        annotations = []
+        # KICS can report the same query at the same location more than once
+        # across platform variants; GitHub only needs each one once
+        seen = set()
+        for query in queries:
+            entry = {k: query[k] for k in QUERY_FIELDS if k in query}
+            entry["files"] = [
+                {k: file[k] for k in FILE_FIELDS if k in file}
+                for file in query.get("files", [])
+            ]
+            slim.append(entry)
+
+            level = SEVERITY_TO_LEVEL.get(query.get("severity", "INFO"), "notice")
+            title = query.get("query_name", "Security Issue")
+            message = query.get("description", "No description available")
+            query_id = query.get("query_id", title)
+            for file in entry["files"]:
+                path = file.get("file_name", "")
+                line = file.get("line", 1)
+                key = (path, line, query_id)
+                if key in seen:
+                    continue
+                seen.add(key)
+                annotations.append({
+                    "path": path,
+                    "start_line": line,
+                    "end_line": line,
+                    "annotation_level": level,
+                    "title": title,
+                    "message": message
+                })
+        return slim, annotations
+
     def _calculate_duration(self, data: dict) -> float:
         """Calculate scan duration from timestamps."""
         try:
-            from datetime import datetime
-            start = datetime.fromisoformat(data.get("start", "").replace("Z", "+00:00"))
-            end = datetime.fromisoformat(data.get("end", "").replace("Z", "+00:00"))
+            # fromisoformat accepts the trailing Z and KICS's extra fraction digits
+            start = datetime.fromisoformat(data.get("start", ""))
+            end = datetime.fromisoformat(data.get("end", ""))
             return (end - start).total_seconds()
         except Exception:
             return 0.0
@@ -1,8 +1,25 @@
+import json
 from dataclasses import dataclass, field
 from typing import Any
 
+# Sub-message headers that open a section, checked in this order
+SECTION_HEADERS = (
+    ("Critical and blocking", "critical_blocking"),
+    ("Other policy violations", "other_violations"),
+    ("Policies Violated:", "policies"),
+    ("Components with Policy Violations:", "components"),
+    ("Components with Policy Violation Warnings:", "warnings"),
+)
+HEADER_PREFIXES = tuple(prefix for prefix, _ in SECTION_HEADERS)
+# Sections whose "* name: count" items are tallied, and sections listing names
+COUNT_SECTIONS = ("critical_blocking", "other_violations")
+LIST_SECTIONS = {
+    "policies": "policies_violated",
+    "components": "components_with_violations",
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class Status:
     issues: list[dict[str, Any]]
     overall_status: list[dict[str, Any]]
@@ -16,6 +33,10 @@ class Status:
             results=data.get("results", []),
         )
 
+    @classmethod
+    def from_json(cls, data: str | bytes) -> "Status":
+        return cls.from_dict(json.loads(data))
+
     def to_dict(self) -> dict:
         return {
             "issues": self.issues,
@@ -47,23 +68,16 @@ class Status:
             for msg in sub_messages:
                 msg = msg.strip()
 
-                if msg.startswith("Critical and blocking"):
-                    section = "critical_blocking"
-                elif msg.startswith("Other policy violations"):
-                    section = "other_violations"
-                elif msg.startswith("Policies Violated:"):
-                    section = "policies"
-                elif msg.startswith("Components with Policy Violations:"):
-                    section = "components"
-                elif msg.startswith("Components with Policy Violation Warnings:"):
-                    section = "warnings"
-                elif msg.startswith("* ") and section in ("critical_blocking", "other_violations"):
-                    parts = msg[2:].split(": ")
-                    if len(parts) == 2:
-                        summary[section][parts[0].strip()] = int(parts[1])
-                elif section == "policies" and msg and not msg.startswith("*"):
-                    summary["policies_violated"].append(msg)
-                elif section == "components" and msg and not msg.startswith("*"):
-                    summary["components_with_violations"].append(msg)
+                # Most messages are items, so one tuple startswith rejects
+                # them before looking for the matching header
+                if msg.startswith(HEADER_PREFIXES):
+                    section = next(name for prefix, name in SECTION_HEADERS if msg.startswith(prefix))
+                elif section in COUNT_SECTIONS:
+                    if msg[:2] == "* ":
+                        parts = msg[2:].split(": ")
+                        if len(parts) == 2:
+                            summary[section][parts[0].strip()] = int(parts[1])
+                elif section in LIST_SECTIONS and msg and msg[0] != "*":
+                    summary[LIST_SECTIONS[section]].append(msg)
 
         return summary